@@ -2,18 +2,85 @@
 Base generator class for all integrations.
 """
 
+import bisect
 import random
-import uuid
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Dict, Tuple, List
+from functools import lru_cache
+from typing import Dict, Tuple, List, Optional
+
+
+# Constant parts of every event, shared by reference between events.
+# Events are serialized as-is and never modified after generation, so
+# these must be treated as read-only.
+_ECS = {"version": "8.11.0"}
+_LABELS = {"synthetic": True}
+_TAGS = ["synthetic", "elastic-data-generator"]
+
+# Random IPs are generated in blocks of this many and handed out one at a time
+_IP_BUFFER_SIZE = 256
+
+
+@lru_cache(maxsize=1)
+def _iso_second(second: int) -> str:
+    """Format whole epoch seconds as "YYYY-MM-DDTHH:MM:SS" (cached for the current second)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+
+
+def _format_timestamp(t: float) -> str:
+    """Format an epoch time as an ISO 8601 UTC timestamp with milliseconds."""
+    second = int(t)
+    return f"{_iso_second(second)}.{int((t - second) * 1000):03d}Z"
+
+
+class AliasSampler:
+    """Constant-time weighted sampling using Walker's alias method."""
+
+    def __init__(self, weights: Dict):
+        values = tuple(weights)
+        n = len(values)
+        total = sum(weights.values())
+        scaled = [w * n / total for w in weights.values()]
+        prob = [1.0] * n
+        alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        self._n = n
+        # (value, alias value, probability of keeping value) per column
+        self._table = tuple((values[i], values[alias[i]], prob[i]) for i in range(n))
+
+    def sample(self, rng: random.Random):
+        """Draw one weighted value using rng."""
+        u = rng.random() * self._n
+        i = int(u)
+        value, other, keep = self._table[i]
+        return value if u - i < keep else other
+
+    def sample_n(self, rng: random.Random, k: int) -> List:
+        """Draw k weighted values using rng."""
+        return [self.sample(rng) for _ in range(k)]
 
 
 class BaseGenerator(ABC):
     """Base class for all data generators."""
 
-    def __init__(self):
+    # Generators that can skip building the raw `message` string honour this
+    include_message: bool = True
+
+    def __init__(self, seed: Optional[int] = None):
         self.event_count = 0
+        # Per-instance RNG so each generator (or worker) can be seeded independently
+        self._rng = random.Random(seed)
+        # Pre-generated IPs for _random_ip, keyed by `private`
+        self._ip_buffers: Dict[bool, List[str]] = {True: [], False: []}
 
     @abstractmethod
     def generate(self) -> Tuple[Dict, str]:
@@ -25,58 +92,92 @@ class BaseGenerator(ABC):
         """
         pass
 
-    def _get_timestamp(self) -> str:
-        """Get current timestamp in ISO format."""
-        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    def generate_batch(self, n: int) -> List[Tuple[Dict, str]]:
+        """
+        Generate n events.
+
+        Generators can override this to draw random fields for the whole
+        batch at once instead of once per event.
+
+        Returns:
+            List of (event_dict, data_stream_name) tuples
+        """
+        return [self.generate() for _ in range(n)]
+
+    def _get_timestamp(self, now: Optional[float] = None) -> str:
+        """Get current (or the given epoch) timestamp in ISO format."""
+        return _format_timestamp(time.time() if now is None else now)
 
     def _random_choice(self, items: List) -> any:
         """Choose a random item from a list."""
-        return random.choice(items)
+        return self._rng.choice(items)
+
+    def _weighted_choice(self, items, cum_weights: List):
+        """Choose a random item using precomputed cumulative weights."""
+        return items[bisect.bisect(cum_weights, self._rng.random() * cum_weights[-1])]
 
     def _random_ip(self, private: bool = True) -> str:
         """Generate a random IP address."""
-        if private:
-            # Private IP ranges
-            ranges = [
-                (10, random.randint(0, 255), random.randint(0, 255), random.randint(1, 254)),
-                (172, random.randint(16, 31), random.randint(0, 255), random.randint(1, 254)),
-                (192, 168, random.randint(0, 255), random.randint(1, 254))
-            ]
-            ip_parts = random.choice(ranges)
-        else:
+        buffer = self._ip_buffers[private]
+        if not buffer:
+            buffer.extend(self._random_ips(_IP_BUFFER_SIZE, private))
+        return buffer.pop()
+
+    def _random_ips(self, n: int, private: bool = True) -> List[str]:
+        """
+        Generate n random IP addresses.
+
+        Octets with a range that isn't a power of two are drawn with randrange
+        so they stay uniform; the full 0-255 octets come from one 16-bit draw.
+        """
+        getrandbits = self._rng.getrandbits
+        randrange = self._rng.randrange
+
+        if not private:
             # Public-looking IPs (avoiding reserved ranges)
-            ip_parts = (
-                random.randint(1, 223),
-                random.randint(0, 255),
-                random.randint(0, 255),
-                random.randint(1, 254)
-            )
-        return ".".join(map(str, ip_parts))
+            return [
+                f"{randrange(1, 224)}.{bits >> 8}.{bits & 0xFF}.{randrange(1, 255)}"
+                for bits in [getrandbits(16) for _ in range(n)]
+            ]
+
+        # Private IP ranges: 10.0.0.0/8, 172.16.0.0/12, 192.168.0.0/16
+        ips = []
+        for _ in range(n):
+            bits = getrandbits(16)
+            b1 = bits >> 8
+            b2 = bits & 0xFF
+            b3 = randrange(1, 255)
+            block = randrange(3)
+            if block == 0:
+                ips.append(f"10.{b1}.{b2}.{b3}")
+            elif block == 1:
+                ips.append(f"172.{16 + (b1 & 0x0F)}.{b2}.{b3}")
+            else:
+                ips.append(f"192.168.{b2}.{b3}")
+        return ips
 
     def _random_uuid(self) -> str:
-        """Generate a random UUID."""
-        return str(uuid.uuid4())
+        """Generate a random UUID-formatted string (version/variant bits are not set)."""
+        h = f"{self._rng.getrandbits(128):032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
     def _random_port(self, well_known: bool = False) -> int:
         """Generate a random port number."""
         if well_known:
-            return random.choice([22, 80, 443, 8080, 3389, 445, 135, 139])
-        return random.randint(1024, 65535)
+            return self._rng.choice([22, 80, 443, 8080, 3389, 445, 135, 139])
+        return self._rng.randint(1024, 65535)
 
-    def _base_event(self, dataset: str, module: str) -> Dict:
-        """Create base event structure with common fields."""
+    def _base_event(self, dataset: str, module: str, now: Optional[float] = None) -> Dict:
+        """Create base event structure with common fields, timestamped now or at the given epoch."""
+        timestamp = self._get_timestamp(now)
         return {
-            "@timestamp": self._get_timestamp(),
+            "@timestamp": timestamp,
             "event": {
                 "dataset": dataset,
                 "module": module,
-                "created": self._get_timestamp()
-            },
-            "ecs": {
-                "version": "8.11.0"
-            },
-            "labels": {
-                "synthetic": True
+                "created": timestamp
             },
-            "tags": ["synthetic", "elastic-data-generator"]
+            "ecs": _ECS,
+            "labels": _LABELS,
+            "tags": _TAGS
         }
@@ -5,9 +5,8 @@ Generates realistic Windows Security, System, and Application events
 following ECS schema with winlog.* fields.
 """
 
-import random
-from datetime import datetime, timezone
-from typing import Dict, Tuple
+from itertools import accumulate, permutations
+from typing import Dict, List, Optional, Tuple
 
 from .base import BaseGenerator
 
@@ -26,37 +25,71 @@ COMPUTER_NAMES = [
 
 DOMAINS = ["CORP", "CONTOSO", "WORKGROUP", "NT AUTHORITY"]
 
-PROCESSES = [
-    {"name": "chrome.exe", "path": "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe"},
-    {"name": "explorer.exe", "path": "C:\\Windows\\explorer.exe"},
-    {"name": "svchost.exe", "path": "C:\\Windows\\System32\\svchost.exe"},
-    {"name": "powershell.exe", "path": "C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\powershell.exe"},
-    {"name": "cmd.exe", "path": "C:\\Windows\\System32\\cmd.exe"},
-    {"name": "notepad.exe", "path": "C:\\Windows\\System32\\notepad.exe"},
-    {"name": "taskmgr.exe", "path": "C:\\Windows\\System32\\taskmgr.exe"},
-    {"name": "msiexec.exe", "path": "C:\\Windows\\System32\\msiexec.exe"},
-    {"name": "outlook.exe", "path": "C:\\Program Files\\Microsoft Office\\root\\Office16\\OUTLOOK.EXE"},
-    {"name": "excel.exe", "path": "C:\\Program Files\\Microsoft Office\\root\\Office16\\EXCEL.EXE"}
-]
+# Process, service and application pools as parallel tuples - pick one index
+# and read each field by position
+PROCESS_NAMES = (
+    "chrome.exe", "explorer.exe", "svchost.exe", "powershell.exe", "cmd.exe",
+    "notepad.exe", "taskmgr.exe", "msiexec.exe", "outlook.exe", "excel.exe"
+)
+PROCESS_PATHS = (
+    "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
+    "C:\\Windows\\explorer.exe",
+    "C:\\Windows\\System32\\svchost.exe",
+    "C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\powershell.exe",
+    "C:\\Windows\\System32\\cmd.exe",
+    "C:\\Windows\\System32\\notepad.exe",
+    "C:\\Windows\\System32\\taskmgr.exe",
+    "C:\\Windows\\System32\\msiexec.exe",
+    "C:\\Program Files\\Microsoft Office\\root\\Office16\\OUTLOOK.EXE",
+    "C:\\Program Files\\Microsoft Office\\root\\Office16\\EXCEL.EXE"
+)
+
+SERVICE_NAMES = ("wuauserv", "BITS", "Dnscache", "EventLog", "Spooler", "W32Time", "WinDefend")
+SERVICE_DISPLAYS = (
+    "Windows Update",
+    "Background Intelligent Transfer Service",
+    "DNS Client",
+    "Windows Event Log",
+    "Print Spooler",
+    "Windows Time",
+    "Windows Defender Antivirus Service"
+)
+
+APP_NAMES = (
+    "Application Error", "Windows Error Reporting", ".NET Runtime",
+    "VSS", "MsiInstaller", "SecurityCenter"
+)
+APP_SOURCES = (
+    "Application Error", "Windows Error Reporting", ".NET Runtime",
+    "VSS", "MsiInstaller", "SecurityCenter"
+)
+
+# Constant parts of Windows events, shared by reference between events
+# (read-only, see base._ECS)
+_HOST_OS = {
+    "family": "windows",
+    "name": "Windows Server 2019",
+    "platform": "windows"
+}
+_CLASSIC_KEYWORDS = ["Classic"]
+_HOST_CACHE = {
+    computer: {"name": computer, "hostname": computer, "os": _HOST_OS}
+    for computer in COMPUTER_NAMES
+}
 
-SERVICES = [
-    {"name": "wuauserv", "display": "Windows Update"},
-    {"name": "BITS", "display": "Background Intelligent Transfer Service"},
-    {"name": "Dnscache", "display": "DNS Client"},
-    {"name": "EventLog", "display": "Windows Event Log"},
-    {"name": "Spooler", "display": "Print Spooler"},
-    {"name": "W32Time", "display": "Windows Time"},
-    {"name": "WinDefend", "display": "Windows Defender Antivirus Service"}
-]
+# Per-event-ID fields of Security events (shared, read-only)
+_AUTHENTICATION = ["authentication"]
+_PROCESS = ["process"]
+_START = ["start"]
+_END = ["end"]
+_AUDIT_SUCCESS = ["Audit Success"]
+_AUDIT_FAILURE = ["Audit Failure"]
 
-APPLICATIONS = [
-    {"name": "Application Error", "source": "Application Error"},
-    {"name": "Windows Error Reporting", "source": "Windows Error Reporting"},
-    {"name": ".NET Runtime", "source": ".NET Runtime"},
-    {"name": "VSS", "source": "VSS"},
-    {"name": "MsiInstaller", "source": "MsiInstaller"},
-    {"name": "SecurityCenter", "source": "SecurityCenter"}
-]
+_SEC_TASK = {4624: "Logon", 4625: "Logon", 4672: "Logon", 4688: "Process Creation", 4689: "Process Creation"}
+_SEC_CATEGORY = {4624: _AUTHENTICATION, 4625: _AUTHENTICATION, 4672: _PROCESS, 4688: _PROCESS, 4689: _PROCESS}
+_SEC_TYPE = {4624: _START, 4688: _START, 4625: _END, 4672: _END, 4689: _END}
+_SEC_KEYWORDS = {4625: _AUDIT_FAILURE}
+_SEC_OUTCOME = {4625: "failure"}
 
 LOGON_TYPES = {
     2: "Interactive",
@@ -67,6 +100,37 @@ LOGON_TYPES = {
     10: "RemoteInteractive",
     11: "CachedInteractive"
 }
+# (LogonType event_data string, logon type name) pairs
+_LOGON_TYPE_ITEMS = tuple((str(code), name) for code, name in LOGON_TYPES.items())
+
+# Common logon failures as parallel tuples: Status, SubStatus and reason
+_FAILURE_STATUS = ("0xc000006d", "0xc000006d", "0xc0000234", "0xc0000072")
+_FAILURE_SUB = ("0xc000006a", "0xc0000064", "0x0", "0x0")
+_FAILURE_REASON = (
+    "Unknown user name or bad password",
+    "User name does not exist",
+    "Account locked out",
+    "Account disabled"
+)
+
+LOGON_PROCESS_NAMES = ("User32", "Advapi", "NtLmSsp")
+AUTHENTICATION_PACKAGES = ("NTLM", "Kerberos", "Negotiate")
+TOKEN_ELEVATION_TYPES = ("%%1936", "%%1937", "%%1938")
+EXIT_CODES = (0, 1, -1)
+SERVICE_STATES = ("running", "stopped")
+EXCEPTION_CODES = ("c0000005", "c0000094", "c0000374")
+
+PRIVILEGES = (
+    "SeSecurityPrivilege", "SeTakeOwnershipPrivilege",
+    "SeLoadDriverPrivilege", "SeBackupPrivilege",
+    "SeRestorePrivilege", "SeDebugPrivilege",
+    "SeSystemEnvironmentPrivilege", "SeImpersonatePrivilege"
+)
+# Every PrivilegeList value for 1-4 assigned privileges, indexed by count
+_PRIVILEGE_LISTS = {
+    k: tuple("\n\t\t\t".join(assigned) for assigned in permutations(PRIVILEGES, k))
+    for k in range(1, 5)
+}
 
 
 class WindowsSecurityGenerator(BaseGenerator):
@@ -82,76 +146,85 @@ class WindowsSecurityGenerator(BaseGenerator):
         {"id": 4689, "weight": 15, "name": "A process has exited"},
         {"id": 4672, "weight": 5, "name": "Special privileges assigned to new logon"}
     ]
+    _EVENT_CUM = list(accumulate(e["weight"] for e in EVENT_TYPES))
+
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(seed)
+        handlers = {
+            4624: self._generate_logon_success,
+            4625: self._generate_logon_failure,
+            4688: self._generate_process_create,
+            4689: self._generate_process_exit,
+            4672: self._generate_special_privilege
+        }
+        # Bound handlers in the same order as EVENT_TYPES, for selection by _EVENT_CUM
+        self._dispatch = tuple(handlers[e["id"]] for e in self.EVENT_TYPES)
 
     def generate(self) -> Tuple[Dict, str]:
         """Generate a Windows Security event."""
-        # Weighted random selection
-        weights = [e["weight"] for e in self.EVENT_TYPES]
-        event_type = random.choices(self.EVENT_TYPES, weights=weights)[0]
-
-        if event_type["id"] == 4624:
-            return self._generate_logon_success(), self.DATA_STREAM
-        elif event_type["id"] == 4625:
-            return self._generate_logon_failure(), self.DATA_STREAM
-        elif event_type["id"] == 4688:
-            return self._generate_process_create(), self.DATA_STREAM
-        elif event_type["id"] == 4689:
-            return self._generate_process_exit(), self.DATA_STREAM
-        elif event_type["id"] == 4672:
-            return self._generate_special_privilege(), self.DATA_STREAM
-
-    def _base_security_event(self, event_id: int, event_name: str) -> Dict:
+        # Weighted random selection of the handler for the event type
+        handler = self._weighted_choice(self._dispatch, self._EVENT_CUM)
+
+        return handler(
+            self._rng.choice(USERNAMES),
+            self._rng.choice(DOMAINS),
+            self._rng.choice(COMPUTER_NAMES)
+        ), self.DATA_STREAM
+
+    def generate_batch(self, n: int) -> List[Tuple[Dict, str]]:
+        """Generate n Windows Security events, drawing the fields common to every event for the whole batch."""
+        handlers = self._rng.choices(self._dispatch, cum_weights=self._EVENT_CUM, k=n)
+        usernames = self._rng.choices(USERNAMES, k=n)
+        domains = self._rng.choices(DOMAINS, k=n)
+        computers = self._rng.choices(COMPUTER_NAMES, k=n)
+
+        return [
+            (handler(username, domain, computer), self.DATA_STREAM)
+            for handler, username, domain, computer in zip(handlers, usernames, domains, computers)
+        ]
+
+    def _base_security_event(self, event_id: int, event_name: str, computer: str) -> Dict:
         """Create base security event structure."""
-        computer = random.choice(COMPUTER_NAMES)
+        code = str(event_id)
         event = self._base_event("windows.security", "windows")
 
-        event.update({
-            "host": {
-                "name": computer,
-                "hostname": computer,
-                "os": {
-                    "family": "windows",
-                    "name": "Windows Server 2019",
-                    "platform": "windows"
-                }
-            },
-            "winlog": {
-                "channel": "Security",
-                "event_id": str(event_id),
-                "provider_name": "Microsoft-Windows-Security-Auditing",
-                "computer_name": computer,
-                "record_id": random.randint(100000, 999999),
-                "task": "Logon" if event_id in [4624, 4625, 4672] else "Process Creation",
-                "keywords": ["Audit Success"] if event_id != 4625 else ["Audit Failure"],
-                "opcode": "Info"
-            },
-            "event": {
-                **event["event"],
-                "code": str(event_id),
-                "action": event_name,
-                "category": ["authentication"] if event_id in [4624, 4625] else ["process"],
-                "type": ["start"] if event_id in [4624, 4688] else ["end"],
-                "outcome": "success" if event_id != 4625 else "failure"
-            },
-            "log": {
-                "level": "information"
-            }
+        event["event"].update({
+            "code": code,
+            "action": event_name,
+            "category": _SEC_CATEGORY[event_id],
+            "type": _SEC_TYPE[event_id],
+            "outcome": _SEC_OUTCOME.get(event_id, "success")
         })
 
+        event["host"] = _HOST_CACHE[computer]
+
+        event["winlog"] = {
+            "channel": "Security",
+            "event_id": code,
+            "provider_name": "Microsoft-Windows-Security-Auditing",
+            "computer_name": computer,
+            "record_id": self._rng.randrange(100000, 1000000),
+            "task": _SEC_TASK[event_id],
+            "keywords": _SEC_KEYWORDS.get(event_id, _AUDIT_SUCCESS),
+            "opcode": "Info"
+        }
+
+        event["log"] = {
+            "level": "information"
+        }
+
         return event
 
-    def _generate_logon_success(self) -> Dict:
+    def _generate_logon_success(self, username: str, domain: str, computer: str) -> Dict:
         """Generate Event ID 4624 - Successful logon."""
-        username = random.choice(USERNAMES)
-        domain = random.choice(DOMAINS)
-        logon_type = random.choice(list(LOGON_TYPES.keys()))
+        logon_type, logon_type_name = self._rng.choice(_LOGON_TYPE_ITEMS)
 
-        event = self._base_security_event(4624, "An account was successfully logged on")
+        event = self._base_security_event(4624, "An account was successfully logged on", computer)
 
         event["user"] = {
             "name": username,
             "domain": domain,
-            "id": f"S-1-5-21-{random.randint(1000000000, 9999999999)}-{random.randint(1000, 9999)}"
+            "id": f"S-1-5-21-{self._rng.randint(1000000000, 9999999999)}-{self._rng.randint(1000, 9999)}"
         }
 
         event["source"] = {
@@ -160,41 +233,32 @@ class WindowsSecurityGenerator(BaseGenerator):
         }
 
         event["winlog"]["logon"] = {
-            "id": hex(random.randint(0x10000, 0xFFFFF)),
-            "type": LOGON_TYPES[logon_type]
+            "id": f"{self._rng.randrange(0x10000, 0x100000):#x}",
+            "type": logon_type_name
         }
 
         event["winlog"]["event_data"] = {
             "TargetUserName": username,
             "TargetDomainName": domain,
-            "LogonType": str(logon_type),
+            "LogonType": logon_type,
             "IpAddress": event["source"]["ip"],
             "IpPort": str(event["source"]["port"]),
-            "WorkstationName": event["host"]["name"],
-            "LogonProcessName": random.choice(["User32", "Advapi", "NtLmSsp"]),
-            "AuthenticationPackageName": random.choice(["NTLM", "Kerberos", "Negotiate"])
+            "WorkstationName": computer,
+            "LogonProcessName": self._rng.choice(LOGON_PROCESS_NAMES),
+            "AuthenticationPackageName": self._rng.choice(AUTHENTICATION_PACKAGES)
         }
 
         event["message"] = f"An account was successfully logged on. Subject: {domain}\\{username}"
 
         return event
 
-    def _generate_logon_failure(self) -> Dict:
+    def _generate_logon_failure(self, username: str, domain: str, computer: str) -> Dict:
         """Generate Event ID 4625 - Failed logon."""
-        username = random.choice(USERNAMES)
-        domain = random.choice(DOMAINS)
-        logon_type = random.choice(list(LOGON_TYPES.keys()))
-
-        # Common failure reasons
-        failure_reasons = [
-            {"status": "0xc000006d", "sub": "0xc000006a", "reason": "Unknown user name or bad password"},
-            {"status": "0xc000006d", "sub": "0xc0000064", "reason": "User name does not exist"},
-            {"status": "0xc0000234", "sub": "0x0", "reason": "Account locked out"},
-            {"status": "0xc0000072", "sub": "0x0", "reason": "Account disabled"}
-        ]
-        failure = random.choice(failure_reasons)
+        logon_type, _ = self._rng.choice(_LOGON_TYPE_ITEMS)
+        fi = self._rng.randrange(len(_FAILURE_REASON))
+        reason = _FAILURE_REASON[fi]
 
-        event = self._base_security_event(4625, "An account failed to log on")
+        event = self._base_security_event(4625, "An account failed to log on", computer)
 
         event["user"] = {
             "name": username,
@@ -209,35 +273,38 @@ class WindowsSecurityGenerator(BaseGenerator):
         event["winlog"]["event_data"] = {
             "TargetUserName": username,
             "TargetDomainName": domain,
-            "LogonType": str(logon_type),
+            "LogonType": logon_type,
             "IpAddress": event["source"]["ip"],
             "IpPort": str(event["source"]["port"]),
-            "Status": failure["status"],
-            "SubStatus": failure["sub"],
-            "FailureReason": failure["reason"]
+            "Status": _FAILURE_STATUS[fi],
+            "SubStatus": _FAILURE_SUB[fi],
+            "FailureReason": reason
         }
 
-        event["message"] = f"An account failed to log on. Subject: {domain}\\{username}. Reason: {failure['reason']}"
+        event["message"] = f"An account failed to log on. Subject: {domain}\\{username}. Reason: {reason}"
 
         return event
 
-    def _generate_process_create(self) -> Dict:
+    def _generate_process_create(self, username: str, domain: str, computer: str) -> Dict:
         """Generate Event ID 4688 - Process creation."""
-        process = random.choice(PROCESSES)
-        parent = random.choice(PROCESSES)
-        username = random.choice(USERNAMES)
-        domain = random.choice(DOMAINS)
+        pi = self._rng.randrange(len(PROCESS_NAMES))
+        parent_pi = self._rng.randrange(len(PROCESS_NAMES))
+        process_name = PROCESS_NAMES[pi]
+        process_path = PROCESS_PATHS[pi]
+        parent_path = PROCESS_PATHS[parent_pi]
+        pid = self._rng.randint(1000, 65000)
+        parent_pid = self._rng.randint(1000, 65000)
 
-        event = self._base_security_event(4688, "A new process has been created")
+        event = self._base_security_event(4688, "A new process has been created", computer)
 
         event["process"] = {
-            "name": process["name"],
-            "executable": process["path"],
-            "pid": random.randint(1000, 65000),
+            "name": process_name,
+            "executable": process_path,
+            "pid": pid,
             "parent": {
-                "name": parent["name"],
-                "executable": parent["path"],
-                "pid": random.randint(1000, 65000)
+                "name": PROCESS_NAMES[parent_pi],
+                "executable": parent_path,
+                "pid": parent_pid
             }
         }
 
@@ -247,32 +314,34 @@ class WindowsSecurityGenerator(BaseGenerator):
         }
 
         event["winlog"]["event_data"] = {
-            "NewProcessId": hex(event["process"]["pid"]),
-            "NewProcessName": process["path"],
-            "ProcessId": hex(event["process"]["parent"]["pid"]),
-            "ParentProcessName": parent["path"],
+            "NewProcessId": f"{pid:#x}",
+            "NewProcessName": process_path,
+            "ProcessId": f"{parent_pid:#x}",
+            "ParentProcessName": parent_path,
             "SubjectUserName": username,
             "SubjectDomainName": domain,
-            "TokenElevationType": random.choice(["%%1936", "%%1937", "%%1938"])
+            "TokenElevationType": self._rng.choice(TOKEN_ELEVATION_TYPES)
         }
 
-        event["message"] = f"A new process has been created. Process: {process['name']} by {domain}\\{username}"
+        event["message"] = f"A new process has been created. Process: {process_name} by {domain}\\{username}"
 
         return event
 
-    def _generate_process_exit(self) -> Dict:
+    def _generate_process_exit(self, username: str, domain: str, computer: str) -> Dict:
         """Generate Event ID 4689 - Process termination."""
-        process = random.choice(PROCESSES)
-        username = random.choice(USERNAMES)
-        domain = random.choice(DOMAINS)
+        pi = self._rng.randrange(len(PROCESS_NAMES))
+        process_name = PROCESS_NAMES[pi]
+        process_path = PROCESS_PATHS[pi]
+        pid = self._rng.randint(1000, 65000)
+        exit_code = self._rng.choice(EXIT_CODES)
 
-        event = self._base_security_event(4689, "A process has exited")
+        event = self._base_security_event(4689, "A process has exited", computer)
 
         event["process"] = {
-            "name": process["name"],
-            "executable": process["path"],
-            "pid": random.randint(1000, 65000),
-            "exit_code": random.choice([0, 1, -1])
+            "name": process_name,
+            "executable": process_path,
+            "pid": pid,
+            "exit_code": exit_code
         }
 
         event["user"] = {
@@ -281,32 +350,23 @@ class WindowsSecurityGenerator(BaseGenerator):
         }
 
         event["winlog"]["event_data"] = {
-            "ProcessId": hex(event["process"]["pid"]),
-            "ProcessName": process["path"],
+            "ProcessId": f"{pid:#x}",
+            "ProcessName": process_path,
             "SubjectUserName": username,
             "SubjectDomainName": domain,
-            "Status": hex(event["process"]["exit_code"])
+            "Status": f"{exit_code:#x}"
         }
 
-        event["message"] = f"A process has exited. Process: {process['name']}"
+        event["message"] = f"A process has exited. Process: {process_name}"
 
         return event
 
-    def _generate_special_privilege(self) -> Dict:
+    def _generate_special_privilege(self, username: str, domain: str, computer: str) -> Dict:
         """Generate Event ID 4672 - Special privileges assigned."""
-        username = random.choice(USERNAMES)
-        domain = random.choice(DOMAINS)
-
-        privileges = [
-            "SeSecurityPrivilege", "SeTakeOwnershipPrivilege",
-            "SeLoadDriverPrivilege", "SeBackupPrivilege",
-            "SeRestorePrivilege", "SeDebugPrivilege",
-            "SeSystemEnvironmentPrivilege", "SeImpersonatePrivilege"
-        ]
+        # Same distribution as sample(PRIVILEGES, randint(1, 4)), without building the list
+        privilege_list = self._rng.choice(_PRIVILEGE_LISTS[self._rng.randint(1, 4)])
 
-        assigned = random.sample(privileges, random.randint(1, 4))
-
-        event = self._base_security_event(4672, "Special privileges assigned to new logon")
+        event = self._base_security_event(4672, "Special privileges assigned to new logon", computer)
 
         event["user"] = {
             "name": username,
@@ -316,7 +376,7 @@ class WindowsSecurityGenerator(BaseGenerator):
         event["winlog"]["event_data"] = {
             "SubjectUserName": username,
             "SubjectDomainName": domain,
-            "PrivilegeList": "\n\t\t\t".join(assigned)
+            "PrivilegeList": privilege_list
         }
 
         event["message"] = f"Special privileges assigned to new logon. User: {domain}\\{username}"
@@ -336,59 +396,60 @@ class WindowsSystemGenerator(BaseGenerator):
         {"id": 6006, "weight": 10, "name": "Event Log service stopped"},
         {"id": 1, "weight": 15, "name": "System time synchronized"}
     ]
+    _EVENT_CUM = list(accumulate(e["weight"] for e in EVENT_TYPES))
 
     def generate(self) -> Tuple[Dict, str]:
         """Generate a Windows System event."""
-        weights = [e["weight"] for e in self.EVENT_TYPES]
-        event_type = random.choices(self.EVENT_TYPES, weights=weights)[0]
+        event_type = self._weighted_choice(self.EVENT_TYPES, self._EVENT_CUM)
+
+        return self._generate_system_event(event_type, self._rng.choice(COMPUTER_NAMES)), self.DATA_STREAM
 
-        return self._generate_system_event(event_type), self.DATA_STREAM
+    def generate_batch(self, n: int) -> List[Tuple[Dict, str]]:
+        """Generate n Windows System events, drawing event types and computers for the whole batch."""
+        event_types = self._rng.choices(self.EVENT_TYPES, cum_weights=self._EVENT_CUM, k=n)
+        computers = self._rng.choices(COMPUTER_NAMES, k=n)
 
-    def _generate_system_event(self, event_type: Dict) -> Dict:
+        return [
+            (self._generate_system_event(event_type, computer), self.DATA_STREAM)
+            for event_type, computer in zip(event_types, computers)
+        ]
+
+    def _generate_system_event(self, event_type: Dict, computer: str) -> Dict:
         """Generate a system event."""
-        computer = random.choice(COMPUTER_NAMES)
         event = self._base_event("windows.system", "windows")
 
-        event.update({
-            "host": {
-                "name": computer,
-                "hostname": computer,
-                "os": {
-                    "family": "windows",
-                    "name": "Windows Server 2019",
-                    "platform": "windows"
-                }
-            },
-            "winlog": {
-                "channel": "System",
-                "event_id": str(event_type["id"]),
-                "provider_name": "Service Control Manager" if event_type["id"] in [7036, 7040] else "EventLog",
-                "computer_name": computer,
-                "record_id": random.randint(100000, 999999),
-                "keywords": ["Classic"],
-                "opcode": "Info"
-            },
-            "event": {
-                **event["event"],
-                "code": str(event_type["id"]),
-                "action": event_type["name"],
-                "category": ["configuration"],
-                "type": ["change"]
-            },
-            "log": {
-                "level": "information"
-            }
+        event["event"].update({
+            "code": str(event_type["id"]),
+            "action": event_type["name"],
+            "category": ["configuration"],
+            "type": ["change"]
         })
 
+        event["host"] = _HOST_CACHE[computer]
+
+        event["winlog"] = {
+            "channel": "System",
+            "event_id": str(event_type["id"]),
+            "provider_name": "Service Control Manager" if event_type["id"] in [7036, 7040] else "EventLog",
+            "computer_name": computer,
+            "record_id": self._rng.randrange(100000, 1000000),
+            "keywords": _CLASSIC_KEYWORDS,
+            "opcode": "Info"
+        }
+
+        event["log"] = {
+            "level": "information"
+        }
+
         if event_type["id"] in [7036, 7040]:
-            service = random.choice(SERVICES)
-            state = random.choice(["running", "stopped"])
+            service_display = self._rng.choice(SERVICE_DISPLAYS)
+            state = self._rng.choice(SERVICE_STATES)
 
             event["winlog"]["event_data"] = {
-                "param1": service["display"],
+                "param1": service_display,
                 "param2": state
             }
-            event["message"] = f"The {service['display']} service entered the {state} state."
+            event["message"] = f"The {service_display} service entered the {state} state."
         elif event_type["id"] == 6005:
             event["message"] = "The Event log service was started."
         elif event_type["id"] == 6006:
@@ -411,67 +472,72 @@ class WindowsApplicationGenerator(BaseGenerator):
         {"id": 11707, "weight": 15, "name": "Installation completed successfully", "level": "information"},
         {"id": 11724, "weight": 10, "name": "Product removal completed", "level": "information"}
     ]
+    _EVENT_CUM = list(accumulate(e["weight"] for e in EVENT_TYPES))
 
     def generate(self) -> Tuple[Dict, str]:
         """Generate a Windows Application event."""
-        weights = [e["weight"] for e in self.EVENT_TYPES]
-        event_type = random.choices(self.EVENT_TYPES, weights=weights)[0]
-
-        return self._generate_app_event(event_type), self.DATA_STREAM
+        event_type = self._weighted_choice(self.EVENT_TYPES, self._EVENT_CUM)
+
+        return self._generate_app_event(
+            event_type,
+            self._rng.choice(COMPUTER_NAMES),
+            self._rng.choice(APP_SOURCES),
+            self._rng.choice(PROCESS_NAMES)
+        ), self.DATA_STREAM
+
+    def generate_batch(self, n: int) -> List[Tuple[Dict, str]]:
+        """Generate n Windows Application events, drawing the per-event choices for the whole batch."""
+        event_types = self._rng.choices(self.EVENT_TYPES, cum_weights=self._EVENT_CUM, k=n)
+        computers = self._rng.choices(COMPUTER_NAMES, k=n)
+        sources = self._rng.choices(APP_SOURCES, k=n)
+        process_names = self._rng.choices(PROCESS_NAMES, k=n)
+
+        return [
+            (self._generate_app_event(event_type, computer, source, process_name), self.DATA_STREAM)
+            for event_type, computer, source, process_name in zip(event_types, computers, sources, process_names)
+        ]
 
-    def _generate_app_event(self, event_type: Dict) -> Dict:
+    def _generate_app_event(self, event_type: Dict, computer: str, source: str, process_name: str) -> Dict:
         """Generate an application event."""
-        computer = random.choice(COMPUTER_NAMES)
-        app = random.choice(APPLICATIONS)
-        process = random.choice(PROCESSES)
-
         event = self._base_event("windows.application", "windows")
 
-        event.update({
-            "host": {
-                "name": computer,
-                "hostname": computer,
-                "os": {
-                    "family": "windows",
-                    "name": "Windows Server 2019",
-                    "platform": "windows"
-                }
-            },
-            "winlog": {
-                "channel": "Application",
-                "event_id": str(event_type["id"]),
-                "provider_name": app["source"],
-                "computer_name": computer,
-                "record_id": random.randint(100000, 999999),
-                "keywords": ["Classic"],
-                "opcode": "Info"
-            },
-            "event": {
-                **event["event"],
-                "code": str(event_type["id"]),
-                "action": event_type["name"],
-                "category": ["process"],
-                "type": ["error"] if event_type["level"] == "error" else ["info"]
-            },
-            "log": {
-                "level": event_type["level"]
-            }
+        event["event"].update({
+            "code": str(event_type["id"]),
+            "action": event_type["name"],
+            "category": ["process"],
+            "type": ["error"] if event_type["level"] == "error" else ["info"]
         })
 
+        event["host"] = _HOST_CACHE[computer]
+
+        event["winlog"] = {
+            "channel": "Application",
+            "event_id": str(event_type["id"]),
+            "provider_name": source,
+            "computer_name": computer,
+            "record_id": self._rng.randrange(100000, 1000000),
+            "keywords": _CLASSIC_KEYWORDS,
+            "opcode": "Info"
+        }
+
+        event["log"] = {
+            "level": event_type["level"]
+        }
+
         if event_type["id"] == 1000:
             event["winlog"]["event_data"] = {
-                "param1": process["name"],
+                "param1": process_name,
                 "param2": "10.0.19041.1",
-                "param3": random.choice(["c0000005", "c0000094", "c0000374"]),
-                "param4": hex(random.randint(0x10000, 0xFFFFF))
+                "param3": self._rng.choice(EXCEPTION_CODES),
+                "param4": f"{self._rng.randrange(0x10000, 0x100000):#x}"
             }
-            event["message"] = f"Faulting application name: {process['name']}, Faulting module: ntdll.dll"
+            event["message"] = f"Faulting application name: {process_name}, Faulting module: ntdll.dll"
         elif event_type["id"] == 1002:
             event["winlog"]["event_data"] = {
-                "param1": process["name"],
+                "param1": process_name,
                 "param2": "10.0.19041.1"
             }
-            event["message"] = f"The program {process['name']} stopped interacting with Windows."
+            event["message"] = f"The program {process_name} stopped interacting with Windows."
         elif event_type["id"] == 11707:
             event["message"] = "Product: Microsoft Visual C++ 2019 -- Installation completed successfully."
         elif event_type["id"] == 11724:
@@ -23,7 +23,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from ui.tui import IntegrationTUI
 from integrations import AVAILABLE_INTEGRATIONS
-from es_client import ElasticsearchClient
+from es_client import ElasticsearchClient, create_action
+from workers import GeneratorWorkers
 
 
 @dataclass
@@ -32,6 +33,9 @@ class GeneratorConfig:
     elasticsearch_host: str = "http://elasticsearch-master:9200"
     elasticsearch_username: str = "elastic"
     elasticsearch_password: str = "elastic"
+    include_message: bool = True
+    workers: int = 0  # Worker processes per integration (0 = generate in its thread)
+    seed: Optional[int] = None
 
 
 @dataclass
@@ -118,41 +122,75 @@ class DataGenerator:
 
     def _run_generator(self, generator_class, state: IntegrationState, stop_event: threading.Event):
         """Run a generator in a thread."""
-        generator = generator_class()
-        sleep_interval = 1.0 / state.events_per_second if state.events_per_second > 0 else 1.0
-        batch_size = 10
-        pending_events = []
-
+        eps = state.events_per_second if state.events_per_second > 0 else 1.0
+
+        # Send one bulk request per tick, sized to the configured rate
+        tick = 0.1
+        batch_size = max(1, int(eps * tick))
+
+        # Failed sends back off exponentially, up to max_backoff seconds
+        max_backoff = 30.0
+        errors = 0
+
+        workers = None
+        if self.config.workers > 0:
+            # Generate in worker processes; this thread only sends
+            workers = GeneratorWorkers(
+                generator_class,
+                batch_size,
+                self.config.workers,
+                seed=self.config.seed,
+                include_message=self.config.include_message
+            )
+            workers.start()
+            # Keep every worker busy only when batches are due every tick;
+            # slower rates request each batch when it is due so its
+            # timestamps are fresh
+            prefetch = batch_size / eps <= tick
+            next_batches = lambda: workers.get_batches(timeout=5, prefetch=prefetch)
+        else:
+            generator = generator_class(seed=self.config.seed)
+            generator.include_message = self.config.include_message
+            next_batches = lambda: [generator.generate_batch(batch_size)]
+
+        next_send = time.perf_counter()
         while not stop_event.is_set():
             try:
-                # Generate event
-                event, data_stream = generator.generate()
-                pending_events.append({
-                    "action": {"create": {"_index": data_stream}},
-                    "doc": event
-                })
-
-                # Send batch
-                if len(pending_events) >= batch_size:
-                    try:
-                        self.es_client.bulk_index(pending_events)
-                        state.total_events += len(pending_events)
-                    except Exception as e:
-                        pass  # Log error but continue
-                    pending_events = []
-
-                time.sleep(sleep_interval)
+                # Generate batches of events - several when more than one
+                # worker has a batch ready
+                batches = [
+                    [{"action": create_action(data_stream), "doc": event} for event, data_stream in batch]
+                    for batch in next_batches()
+                ]
+                sent = sum(len(batch) for batch in batches)
+
+                # Send batches, overlapping the requests when there are several
+                try:
+                    self.es_client.bulk_many(batches)
+                    state.total_events += sent
+                    errors = 0
+                except Exception as e:
+                    # Drop the batches and back off while the cluster is unavailable
+                    errors = min(errors + 1, 10)
+                    stop_event.wait(min(max_backoff, 0.1 * 2 ** errors))
+                    next_send = time.perf_counter()
+                    continue
+
+                # Each send is due len/eps seconds after the previous one,
+                # so time spent generating and sending counts toward the tick
+                next_send += sent / eps
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    stop_event.wait(delay)  # Wakes early on stop
+                elif delay < -1.0:
+                    # Fell well behind (slow cluster) - don't burst to catch up
+                    next_send = time.perf_counter()
 
             except Exception as e:
-                time.sleep(1)
+                stop_event.wait(1)
 
-        # Send remaining events
-        if pending_events:
-            try:
-                self.es_client.bulk_index(pending_events)
-                state.total_events += len(pending_events)
-            except:
-                pass
+        if workers:
+            workers.stop()
 
         state.running = False
 
@@ -202,7 +240,10 @@ def main():
     config = GeneratorConfig(
         elasticsearch_host=os.environ.get("ELASTICSEARCH_HOST", "http://elasticsearch-master:9200"),
         elasticsearch_username=os.environ.get("ELASTICSEARCH_USERNAME", "elastic"),
-        elasticsearch_password=os.environ.get("ELASTICSEARCH_PASSWORD", "elastic")
+        elasticsearch_password=os.environ.get("ELASTICSEARCH_PASSWORD", "elastic"),
+        include_message=os.environ.get("ELASTIC_DATA_INCLUDE_MESSAGE", "true").lower() != "false",
+        workers=int(os.environ.get("ELASTIC_DATA_WORKERS", "0")),
+        seed=int(os.environ["ELASTIC_DATA_SEED"]) if os.environ.get("ELASTIC_DATA_SEED") else None
     )
 
     # Create generator
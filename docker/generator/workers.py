@@ -0,0 +1,133 @@
+"""
+Multiprocess event generation.
+
+Generation is pure Python and CPU-bound, so a single process is limited by
+the GIL. Worker processes generate and encode batches on request from the
+integration's sender thread, which sends them as bulk requests. Batches are
+only generated when asked for, so their timestamps stay close to send time.
+"""
+
+import multiprocessing
+import queue
+from typing import List, Optional, Tuple
+
+from es_client import encode_document
+
+
+def generate_worker(generator_class, request_queue, out_queue, batch_size: int,
+                    seed: Optional[int], stop_event, include_message: bool = True):
+    """Worker process entry point: put an encoded batch on out_queue for each request until stop_event is set."""
+    generator = generator_class(seed=seed)
+    generator.include_message = include_message
+
+    try:
+        while not stop_event.is_set():
+            try:
+                request_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            # Encode here so the sender thread only concatenates bytes,
+            # and so the queue pickles flat bytes rather than nested dicts
+            out_queue.put([
+                (encode_document(event), data_stream)
+                for event, data_stream in generator.generate_batch(batch_size)
+            ])
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Don't block exit on batches the parent will never read
+        out_queue.cancel_join_thread()
+
+
+class GeneratorWorkers:
+    """Pool of worker processes generating batches for one integration."""
+
+    def __init__(self, generator_class, batch_size: int, processes: int,
+                 seed: Optional[int] = None, include_message: bool = True):
+        # spawn rather than fork - the parent runs threads and curses
+        context = multiprocessing.get_context("spawn")
+        self._requests = context.Queue()
+        self._queue = context.Queue()
+        self._stop_event = context.Event()
+
+        # Batches requested but not yet received
+        self._outstanding = 0
+        self._processes = [
+            context.Process(
+                target=generate_worker,
+                args=(
+                    generator_class,
+                    self._requests,
+                    self._queue,
+                    batch_size,
+                    seed + i if seed is not None else None,
+                    self._stop_event,
+                    include_message
+                ),
+                daemon=True
+            )
+            for i in range(processes)
+        ]
+
+    def start(self):
+        """Start all worker processes."""
+        for process in self._processes:
+            process.start()
+
+    def get_batch(self, timeout: Optional[float] = None,
+                  prefetch: bool = False) -> List[Tuple[bytes, str]]:
+        """
+        Get the next generated batch as (encoded_document, data_stream_name) tuples.
+
+        With prefetch, one request per worker is kept in flight so all of
+        them generate in parallel. Only use it when batches are due in quick
+        succession, as each batch is stamped up to that many batches ahead of
+        its send. Without it, a batch is requested only when it is wanted.
+
+        Raises:
+            queue.Empty if no batch arrives within timeout
+        """
+        in_flight = len(self._processes) if prefetch else 1
+        while self._outstanding < in_flight:
+            self._requests.put(None)
+            self._outstanding += 1
+
+        try:
+            batch = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            # A worker may have died holding a request - forget the
+            # outstanding ones so the next call requests afresh
+            self._outstanding = 0
+            raise
+        self._outstanding -= 1
+        return batch
+
+    def get_batches(self, timeout: Optional[float] = None,
+                    prefetch: bool = False) -> List[List[Tuple[bytes, str]]]:
+        """
+        Get the next batch, plus any other requested batches that are already generated.
+
+        Raises:
+            queue.Empty if no batch arrives within timeout
+        """
+        batches = [self.get_batch(timeout=timeout, prefetch=prefetch)]
+        while self._outstanding > 0:
+            try:
+                batches.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+        return batches
+
+    def stop(self):
+        """Stop all worker processes."""
+        self._stop_event.set()
+
+        # Don't block exit on requests no worker will take
+        self._requests.cancel_join_thread()
+
+        for process in self._processes:
+            process.join(timeout=2)
+            if process.is_alive():
+                process.terminate()
@@ -1,25 +1,107 @@
 """
 Elasticsearch client for bulk indexing.
-Uses urllib to avoid external dependencies.
+Uses http.client to avoid external dependencies.
+orjson is used for encoding when available, with stdlib json as fallback.
 """
 
+import gzip
+import itertools
 import json
+import queue
 import ssl
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+import threading
+import zlib
+from collections import deque
+from functools import lru_cache
+from http.client import HTTPConnection, HTTPSConnection, HTTPException, RemoteDisconnected
+from urllib.parse import urlsplit
 from base64 import b64encode
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - not required
+    orjson = None
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+
+# Bulk bodies larger than this are streamed in chunks of about this size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=64)
+def create_action(index: str) -> bytes:
+    """Get the pre-encoded bulk "create" action line (with newline) for an index."""
+    return _dumps({"create": {"_index": index}}) + b"\n"
+
+
+def encode_document(doc: Dict) -> bytes:
+    """Encode a document for bulk_index() ahead of time (e.g. in a worker process)."""
+    return _dumps(doc)
+
+
+def _ndjson_chunks(actions: List[Dict]) -> Iterator[bytes]:
+    """Serialize bulk actions to NDJSON, yielding chunks of about STREAM_CHUNK_SIZE bytes."""
+    buf = bytearray()
+    for action in actions:
+        line = action["action"]
+        if isinstance(line, bytes):
+            buf += line
+        else:
+            buf += _dumps(line)
+            buf += b"\n"
+        doc = action["doc"]
+        buf += doc if isinstance(doc, bytes) else _dumps(doc)
+        buf += b"\n"
+        if len(buf) >= STREAM_CHUNK_SIZE:
+            yield bytes(buf)
+            buf.clear()
+    if buf:
+        yield bytes(buf)
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip a stream of chunks incrementally."""
+    # Repeated ECS field names compress very well - level 1 is plenty
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
 
 
 class ElasticsearchClient:
-    """Simple Elasticsearch client using urllib (no external deps)."""
+    """Simple Elasticsearch client using http.client (no external deps)."""
 
-    def __init__(self, host: str, username: str, password: str, verify_ssl: bool = False):
+    def __init__(self, host: str, username: str, password: str, verify_ssl: bool = False,
+                 pool_size: int = 8):
         self.host = host.rstrip('/')
         self.auth_header = 'Basic ' + b64encode(f"{username}:{password}".encode()).decode()
         self.verify_ssl = verify_ssl
         self._ssl_context = self._create_ssl_context()
 
+        parsed = urlsplit(self.host)
+        self._https = parsed.scheme == "https"
+        self._netloc = parsed.netloc
+        self._base_path = parsed.path
+
+        # Idle keep-alive connections, shared by all generator threads
+        self._pool: "queue.LifoQueue" = queue.LifoQueue(maxsize=pool_size)
+
     def _create_ssl_context(self) -> ssl.SSLContext:
         """Create SSL context."""
         context = ssl.create_default_context()
@@ -28,53 +110,166 @@ class ElasticsearchClient:
             context.verify_mode = ssl.CERT_NONE
         return context
 
+    def _get_connection(self, timeout: float) -> HTTPConnection:
+        """Take an idle connection from the pool, or open a new one."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            if self._https:
+                return HTTPSConnection(self._netloc, timeout=timeout, context=self._ssl_context)
+            return HTTPConnection(self._netloc, timeout=timeout)
+
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _release_connection(self, conn: HTTPConnection):
+        """Return a connection to the pool for reuse."""
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _request(self, method: str, path: str,
+                 body: Union[bytes, Callable[[], Iterable[bytes]], None] = None,
+                 headers: Optional[Dict] = None, timeout: float = 30) -> Tuple[int, bytes]:
+        """
+        Send a request over a pooled keep-alive connection.
+
+        body may be bytes, or a callable returning an iterable of chunks to
+        send with chunked transfer encoding. The callable is called again if
+        the request has to be retried.
+
+        Returns:
+            Tuple of (status_code, response_body)
+        """
+        headers = {"Authorization": self.auth_header, "Accept-Encoding": "gzip", **(headers or {})}
+
+        while True:
+            conn = self._get_connection(timeout)
+            reused = conn.sock is not None
+
+            try:
+                data = body() if callable(body) else body
+                conn.request(method, self._base_path + path, body=data, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                conn.close()
+                # The server may drop idle keep-alive connections - retry on a fresh one
+                if reused:
+                    continue
+                raise Exception(f"URL Error: {e}")
+            except (OSError, HTTPException) as e:
+                conn.close()
+                raise Exception(f"URL Error: {e}")
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release_connection(conn)
+
+            if response.getheader("Content-Encoding") == "gzip":
+                data = gzip.decompress(data)
+
+            return response.status, data
+
     def bulk_index(self, actions: List[Dict]) -> Dict:
-        """Send bulk indexing request to Elasticsearch."""
-        url = f"{self.host}/_bulk"
+        """
+        Send bulk indexing request to Elasticsearch.
 
-        # Build NDJSON body
-        body = ""
-        for action in actions:
-            body += json.dumps(action["action"]) + "\n"
-            body += json.dumps(action["doc"]) + "\n"
+        Each action's "action" may be a dict, or pre-encoded bytes from create_action(),
+        and its "doc" a dict, or pre-encoded bytes from encode_document().
+        """
+        headers = {"Content-Type": "application/x-ndjson"}
 
-        headers = {
-            "Content-Type": "application/x-ndjson",
-            "Authorization": self.auth_header
-        }
+        chunks = _ndjson_chunks(actions)
+        first = next(chunks, b"")
+        second = next(chunks, None)
 
-        request = Request(url, data=body.encode('utf-8'), headers=headers, method='POST')
+        if second is None:
+            # Small enough to send as a single buffer
+            if len(first) > GZIP_MIN_SIZE:
+                body = gzip.compress(first, compresslevel=1)
+                headers["Content-Encoding"] = "gzip"
+            else:
+                body = first
+        else:
+            # Stream large bodies so the full payload is never held in memory
+            headers["Content-Encoding"] = "gzip"
+            pending = itertools.chain((first, second), chunks)
 
-        try:
-            with urlopen(request, context=self._ssl_context, timeout=30) as response:
-                return json.loads(response.read().decode('utf-8'))
-        except HTTPError as e:
-            error_body = e.read().decode('utf-8') if e.fp else str(e)
-            raise Exception(f"HTTP Error {e.code}: {error_body}")
-        except URLError as e:
-            raise Exception(f"URL Error: {e.reason}")
+            def body():
+                nonlocal pending
+                source, pending = pending, None
+                # A retry re-serializes from the start
+                return _gzip_chunks(source if source is not None else _ndjson_chunks(actions))
+
+        status, data = self._request("POST", "/_bulk", body=body, headers=headers, timeout=30)
+        if status >= 400:
+            raise Exception(f"HTTP Error {status}: {data.decode('utf-8', 'replace')}")
+        return _loads(data)
+
+    def bulk_many(self, batches: List[List[Dict]], concurrency: int = 8) -> List[Dict]:
+        """
+        Send several bulk requests with up to `concurrency` in flight at once.
+
+        Returns:
+            List of bulk responses, in the same order as `batches`
+        """
+        if len(batches) <= 1 or concurrency <= 1:
+            return [self.bulk_index(batch) for batch in batches]
+
+        results: List[Optional[Dict]] = [None] * len(batches)
+        errors: List[Exception] = []
+        pending = deque(enumerate(batches))
+
+        def send():
+            while True:
+                try:
+                    i, batch = pending.popleft()
+                except IndexError:
+                    return
+                try:
+                    results[i] = self.bulk_index(batch)
+                except Exception as e:
+                    errors.append(e)
+
+        # Daemon threads, so a stalled request can't hold up interpreter exit;
+        # this thread sends its share too
+        threads = [
+            threading.Thread(target=send, daemon=True)
+            for _ in range(min(concurrency, len(batches)) - 1)
+        ]
+        for thread in threads:
+            thread.start()
+        send()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+        return results
+
+    def _get_json(self, path: str, timeout: float = 10) -> Dict:
+        """GET a JSON document, raising on connection or HTTP errors."""
+        status, data = self._request("GET", path, timeout=timeout)
+        if status >= 400:
+            raise Exception(f"HTTP Error {status}: {data.decode('utf-8', 'replace')}")
+        return _loads(data)
 
     def check_connection(self) -> bool:
         """Check if Elasticsearch is reachable."""
-        url = f"{self.host}/"
-        headers = {"Authorization": self.auth_header}
-        request = Request(url, headers=headers)
-
         try:
-            with urlopen(request, context=self._ssl_context, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                return True
+            self._get_json("/")
+            return True
         except Exception:
             return False
 
     def get_cluster_info(self) -> Optional[Dict]:
         """Get cluster information."""
-        url = f"{self.host}/"
-        headers = {"Authorization": self.auth_header}
-        request = Request(url, headers=headers)
-
         try:
-            with urlopen(request, context=self._ssl_context, timeout=10) as response:
-                return json.loads(response.read().decode('utf-8'))
+            return self._get_json("/")
         except Exception:
             return None
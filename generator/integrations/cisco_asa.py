@@ -4,145 +4,92 @@ Cisco ASA firewall log generator.
 Generates realistic Cisco ASA syslog events following ECS schema.
 """
 
-import random
-from datetime import datetime, timezone
-from typing import Dict, Tuple
+from collections import namedtuple
+from itertools import accumulate
+from typing import Dict, List, Tuple
 
 from .base import BaseGenerator
 
 
 # Common Cisco ASA message IDs and their meanings
-ASA_MESSAGES = [
-    {
-        "id": "106001",
-        "severity": 2,
-        "weight": 5,
-        "type": "Inbound TCP connection denied",
-        "action": "denied"
-    },
-    {
-        "id": "106006",
-        "severity": 2,
-        "weight": 5,
-        "type": "Deny inbound UDP",
-        "action": "denied"
-    },
-    {
-        "id": "106007",
-        "severity": 2,
-        "weight": 3,
-        "type": "Deny inbound UDP due to DNS",
-        "action": "denied"
-    },
-    {
-        "id": "106014",
-        "severity": 3,
-        "weight": 5,
-        "type": "Deny inbound icmp",
-        "action": "denied"
-    },
-    {
-        "id": "106015",
-        "severity": 6,
-        "weight": 3,
-        "type": "Deny TCP (no connection)",
-        "action": "denied"
-    },
-    {
-        "id": "106023",
-        "severity": 4,
-        "weight": 8,
-        "type": "Deny by access-group",
-        "action": "denied"
-    },
-    {
-        "id": "106100",
-        "severity": 6,
-        "weight": 15,
-        "type": "access-list permitted/denied",
-        "action": "allowed"
-    },
-    {
-        "id": "302013",
-        "severity": 6,
-        "weight": 20,
-        "type": "Built inbound TCP connection",
-        "action": "allowed"
-    },
-    {
-        "id": "302014",
-        "severity": 6,
-        "weight": 10,
-        "type": "Teardown TCP connection",
-        "action": "allowed"
-    },
-    {
-        "id": "302015",
-        "severity": 6,
-        "weight": 15,
-        "type": "Built inbound UDP connection",
-        "action": "allowed"
-    },
-    {
-        "id": "302016",
-        "severity": 6,
-        "weight": 8,
-        "type": "Teardown UDP connection",
-        "action": "allowed"
-    },
-    {
-        "id": "302020",
-        "severity": 6,
-        "weight": 3,
-        "type": "Built inbound ICMP connection",
-        "action": "allowed"
-    },
-    {
-        "id": "302021",
-        "severity": 6,
-        "weight": 2,
-        "type": "Teardown ICMP connection",
-        "action": "allowed"
-    },
-    {
-        "id": "305011",
-        "severity": 6,
-        "weight": 10,
-        "type": "Built dynamic translation",
-        "action": "allowed"
-    },
-    {
-        "id": "305012",
-        "severity": 6,
-        "weight": 5,
-        "type": "Teardown dynamic translation",
-        "action": "allowed"
-    },
-    {
-        "id": "313001",
-        "severity": 3,
-        "weight": 3,
-        "type": "Denied ICMP type",
-        "action": "denied"
-    },
-    {
-        "id": "710003",
-        "severity": 6,
-        "weight": 5,
-        "type": "TCP access permitted",
-        "action": "allowed"
-    },
-    {
-        "id": "733100",
-        "severity": 4,
-        "weight": 2,
-        "type": "Threat detection rate exceeded",
-        "action": "alert"
-    }
-]
+AsaMsg = namedtuple("AsaMsg", "id severity weight type action")
+
+ASA_MESSAGES = (
+    AsaMsg("106001", 2, 5, "Inbound TCP connection denied", "denied"),
+    AsaMsg("106006", 2, 5, "Deny inbound UDP", "denied"),
+    AsaMsg("106007", 2, 3, "Deny inbound UDP due to DNS", "denied"),
+    AsaMsg("106014", 3, 5, "Deny inbound icmp", "denied"),
+    AsaMsg("106015", 6, 3, "Deny TCP (no connection)", "denied"),
+    AsaMsg("106023", 4, 8, "Deny by access-group", "denied"),
+    AsaMsg("106100", 6, 15, "access-list permitted/denied", "allowed"),
+    AsaMsg("302013", 6, 20, "Built inbound TCP connection", "allowed"),
+    AsaMsg("302014", 6, 10, "Teardown TCP connection", "allowed"),
+    AsaMsg("302015", 6, 15, "Built inbound UDP connection", "allowed"),
+    AsaMsg("302016", 6, 8, "Teardown UDP connection", "allowed"),
+    AsaMsg("302020", 6, 3, "Built inbound ICMP connection", "allowed"),
+    AsaMsg("302021", 6, 2, "Teardown ICMP connection", "allowed"),
+    AsaMsg("305011", 6, 10, "Built dynamic translation", "allowed"),
+    AsaMsg("305012", 6, 5, "Teardown dynamic translation", "allowed"),
+    AsaMsg("313001", 3, 3, "Denied ICMP type", "denied"),
+    AsaMsg("710003", 6, 5, "TCP access permitted", "allowed"),
+    AsaMsg("733100", 4, 2, "Threat detection rate exceeded", "alert")
+)
+
+# Cumulative weights for bisect-based weighted selection
+_ASA_CUM = list(accumulate(m.weight for m in ASA_MESSAGES))
+
+BUILT_MSG_IDS = ("302013", "302015", "302020")
+TEARDOWN_MSG_IDS = ("302014", "302016", "302021")
+NAT_MSG_IDS = ("305011", "305012")
+
+
+def _message_template(msg: AsaMsg) -> str:
+    """Get the str.format template for a message type, with its constant parts filled in."""
+    msg_id = msg.id
+
+    if msg_id in BUILT_MSG_IDS:
+        template = (
+            '%ASA-6-<id>: Built {direction} {protocol} connection {conn_id} for {src_if}:{src_ip}/{src_port} '
+            'to {dst_if}:{dst_ip}/{dst_port}'
+        )
+    elif msg_id in TEARDOWN_MSG_IDS:
+        template = (
+            '%ASA-6-<id>: Teardown {protocol} connection {conn_id} for {src_if}:{src_ip}/{src_port} '
+            'to {dst_if}:{dst_ip}/{dst_port} duration {duration} bytes {bytes_sent}'
+        )
+    elif msg_id == "106023":
+        template = (
+            '%ASA-4-<id>: Deny {protocol} src {src_if}:{src_ip}/{src_port} '
+            'dst {dst_if}:{dst_ip}/{dst_port} by access-group "{acl}"'
+        )
+    elif msg_id == "106100":
+        action = "permitted" if msg.action == "allowed" else "denied"
+        template = (
+            f'%ASA-6-<id>: access-list {{acl}} {action} {{protocol}} '
+            '{src_if}/{src_ip}({src_port}) -> {dst_if}/{dst_ip}({dst_port}) hit-cnt {hit_cnt}'
+        )
+    elif msg_id in NAT_MSG_IDS:
+        action = "Built" if msg_id == "305011" else "Teardown"
+        template = (
+            f'%ASA-6-<id>: {action} dynamic {{protocol}} translation from '
+            '{src_if}:{src_ip}/{src_port} to {dst_if}:{global_ip}/{global_port}'
+        )
+    elif msg_id == "733100":
+        template = '%ASA-4-<id>: [<type>] drop rate exceeded. Current rate: {rate}/sec, trigger rate: 100/sec'
+    elif msg_id == "710003":
+        template = '%ASA-6-<id>: {protocol} access permitted from {src_ip}/{src_port} to {dst_if}:{dst_ip}/{dst_port}'
+    else:
+        # Generic deny messages
+        template = f'%ASA-{msg.severity}-<id>: <type> from {{src_ip}} to {{dst_ip}} on interface {{src_if}}'
+
+    return template.replace("<id>", msg_id).replace("<type>", msg.type)
+
 
 INTERFACES = ["outside", "inside", "dmz", "management", "guest"]
 
+# Interfaces other than the key, for picking a distinct destination interface
+_OTHER_INTERFACES = {x: tuple(i for i in INTERFACES if i != x) for x in INTERFACES}
+
 PROTOCOLS = ["TCP", "UDP", "ICMP", "GRE", "ESP"]
 
 FIREWALL_NAMES = ["ASA-FW-01", "ASA-FW-02", "ASA-EDGE-01", "ASA-CORE-01"]
@@ -151,15 +98,18 @@ ACCESS_LISTS = ["outside_access_in", "inside_access_out", "dmz_access_in", "glob
 
 # Common ports for more realistic traffic
 COMMON_PORTS = {
-    "web": [80, 443, 8080, 8443],
-    "mail": [25, 110, 143, 465, 587, 993, 995],
-    "dns": [53],
-    "ssh": [22],
-    "rdp": [3389],
-    "database": [1433, 1521, 3306, 5432, 27017],
-    "other": [21, 23, 135, 139, 445, 389, 636, 88]
+    "web": (80, 443, 8080, 8443),
+    "mail": (25, 110, 143, 465, 587, 993, 995),
+    "dns": (53,),
+    "ssh": (22,),
+    "rdp": (3389,),
+    "database": (1433, 1521, 3306, 5432, 27017),
+    "other": (21, 23, 135, 139, 445, 389, 636, 88)
 }
 
+# Port lists by category, for picking a category without building a key list
+_PORT_GROUPS = tuple(COMMON_PORTS.values())
+
 
 class CiscoASAGenerator(BaseGenerator):
     """Generator for Cisco ASA syslog events."""
@@ -177,43 +127,60 @@ class CiscoASAGenerator(BaseGenerator):
         7: "debugging"
     }
 
+    # Syslog message templates, keyed by message ID.
+    # Building `message` is skipped when include_message is False - the ECS
+    # fields are complete without it and it can be re-derived at query time.
+    _MSG_TEMPLATES: Dict[str, str] = {m.id: _message_template(m) for m in ASA_MESSAGES}
+
     def generate(self) -> Tuple[Dict, str]:
         """Generate a Cisco ASA syslog event."""
         # Weighted selection of message type
-        weights = [m["weight"] for m in ASA_MESSAGES]
-        msg = random.choices(ASA_MESSAGES, weights=weights)[0]
+        msg = self._weighted_choice(ASA_MESSAGES, _ASA_CUM)
 
         return self._generate_asa_event(msg), self.DATA_STREAM
 
+    def generate_batch(self, n: int) -> List[Tuple[Dict, str]]:
+        """Generate n Cisco ASA syslog events, drawing message types for the whole batch."""
+        msgs = self._rng.choices(ASA_MESSAGES, cum_weights=_ASA_CUM, k=n)
+
+        return [(self._generate_asa_event(msg), self.DATA_STREAM) for msg in msgs]
+
     def _get_port_pair(self) -> Tuple[int, int]:
         """Generate realistic source and destination ports."""
         # Pick a category
-        category = random.choice(list(COMMON_PORTS.keys()))
-        dst_port = random.choice(COMMON_PORTS[category])
-        src_port = random.randint(1024, 65535)
+        dst_port = self._rng.choice(self._rng.choice(_PORT_GROUPS))
+        src_port = self._rng.randint(1024, 65535)
         return src_port, dst_port
 
-    def _generate_asa_event(self, msg: Dict) -> Dict:
+    def _generate_asa_event(self, msg: AsaMsg) -> Dict:
         """Generate a Cisco ASA event based on message type."""
-        timestamp = self._get_timestamp()
-        firewall = random.choice(FIREWALL_NAMES)
+        firewall = self._rng.choice(FIREWALL_NAMES)
 
         # Generate IPs
         src_ip = self._random_ip(private=False)
         dst_ip = self._random_ip(private=True)
 
         # Sometimes reverse for outbound
-        if random.random() < 0.3:
+        if self._rng.random() < 0.3:
             src_ip, dst_ip = dst_ip, src_ip
 
         src_port, dst_port = self._get_port_pair()
-        protocol = random.choice(["TCP", "UDP"]) if msg["id"].startswith("302") else random.choice(PROTOCOLS)
+        protocol = self._rng.choice(["TCP", "UDP"]) if msg.id.startswith("302") else self._rng.choice(PROTOCOLS)
 
-        src_interface = random.choice(INTERFACES)
-        dst_interface = random.choice([i for i in INTERFACES if i != src_interface])
+        src_interface = self._rng.choice(INTERFACES)
+        dst_interface = self._rng.choice(_OTHER_INTERFACES[src_interface])
 
         event = self._base_event("cisco_asa.log", "cisco_asa")
 
+        event["event"].update({
+            "code": msg.id,
+            "action": msg.action,
+            "category": ["network"],
+            "type": ["connection", "allowed" if msg.action == "allowed" else "denied"],
+            "outcome": "success" if msg.action == "allowed" else "failure",
+            "severity": msg.severity
+        })
+
         event.update({
             "host": {
                 "name": firewall,
@@ -240,21 +207,12 @@ class CiscoASAGenerator(BaseGenerator):
                 "transport": protocol.lower() if protocol in ["TCP", "UDP"] else "ip",
                 "direction": "inbound" if src_interface == "outside" else "outbound"
             },
-            "event": {
-                **event["event"],
-                "code": msg["id"],
-                "action": msg["action"],
-                "category": ["network"],
-                "type": ["connection", "allowed" if msg["action"] == "allowed" else "denied"],
-                "outcome": "success" if msg["action"] == "allowed" else "failure",
-                "severity": msg["severity"]
-            },
             "log": {
-                "level": self.SEVERITY_NAMES.get(msg["severity"], "informational"),
+                "level": self.SEVERITY_NAMES.get(msg.severity, "informational"),
                 "syslog": {
                     "severity": {
-                        "code": msg["severity"],
-                        "name": self.SEVERITY_NAMES.get(msg["severity"], "informational")
+                        "code": msg.severity,
+                        "name": self.SEVERITY_NAMES.get(msg.severity, "informational")
                     },
                     "facility": {
                         "code": 20,
@@ -264,7 +222,7 @@ class CiscoASAGenerator(BaseGenerator):
             },
             "cisco": {
                 "asa": {
-                    "message_id": msg["id"],
+                    "message_id": msg.id,
                     "source_interface": src_interface,
                     "destination_interface": dst_interface
                 }
@@ -272,86 +230,45 @@ class CiscoASAGenerator(BaseGenerator):
         })
 
         # Generate message based on type
-        event["message"] = self._build_message(msg, event)
+        if self.include_message:
+            event["message"] = self._build_message(msg, event)
 
         return event
 
-    def _build_message(self, msg: Dict, event: Dict) -> str:
+    def _build_message(self, msg: AsaMsg, event: Dict) -> str:
         """Build the syslog message string."""
         src = event["source"]
         dst = event["destination"]
         cisco = event["cisco"]["asa"]
-        protocol = event["network"]["protocol"].upper()
-
-        msg_id = msg["id"]
-
-        if msg_id in ["302013", "302015", "302020"]:
-            # Built connection
-            conn_id = random.randint(100000, 9999999)
-            return (
-                f'%ASA-6-{msg_id}: Built {"inbound" if cisco["source_interface"] == "outside" else "outbound"} '
-                f'{protocol} connection {conn_id} for {cisco["source_interface"]}:{src["ip"]}/{src["port"]} '
-                f'to {cisco["destination_interface"]}:{dst["ip"]}/{dst["port"]}'
-            )
-
-        elif msg_id in ["302014", "302016", "302021"]:
-            # Teardown connection
-            conn_id = random.randint(100000, 9999999)
-            duration = f"{random.randint(0,23):02d}:{random.randint(0,59):02d}:{random.randint(0,59):02d}"
-            bytes_sent = random.randint(100, 1000000)
-            return (
-                f'%ASA-6-{msg_id}: Teardown {protocol} connection {conn_id} for '
-                f'{cisco["source_interface"]}:{src["ip"]}/{src["port"]} to '
-                f'{cisco["destination_interface"]}:{dst["ip"]}/{dst["port"]} duration {duration} bytes {bytes_sent}'
-            )
 
+        fields = {
+            "protocol": event["network"]["protocol"].upper(),
+            "direction": event["network"]["direction"],
+            "src_if": cisco["source_interface"],
+            "src_ip": src["ip"],
+            "src_port": src["port"],
+            "dst_if": cisco["destination_interface"],
+            "dst_ip": dst["ip"],
+            "dst_port": dst["port"]
+        }
+
+        # Per-event values only needed by some message types
+        msg_id = msg.id
+        if msg_id in BUILT_MSG_IDS:
+            fields["conn_id"] = self._rng.randint(100000, 9999999)
+        elif msg_id in TEARDOWN_MSG_IDS:
+            fields["conn_id"] = self._rng.randint(100000, 9999999)
+            fields["duration"] = f"{self._rng.randint(0,23):02d}:{self._rng.randint(0,59):02d}:{self._rng.randint(0,59):02d}"
+            fields["bytes_sent"] = self._rng.randint(100, 1000000)
         elif msg_id == "106023":
-            # Deny by access-group
-            acl = random.choice(ACCESS_LISTS)
-            return (
-                f'%ASA-4-{msg_id}: Deny {protocol} src {cisco["source_interface"]}:{src["ip"]}/{src["port"]} '
-                f'dst {cisco["destination_interface"]}:{dst["ip"]}/{dst["port"]} by access-group "{acl}"'
-            )
-
+            fields["acl"] = self._rng.choice(ACCESS_LISTS)
         elif msg_id == "106100":
-            # access-list permitted/denied
-            acl = random.choice(ACCESS_LISTS)
-            action = "permitted" if msg["action"] == "allowed" else "denied"
-            hit_cnt = random.randint(1, 1000)
-            return (
-                f'%ASA-6-{msg_id}: access-list {acl} {action} {protocol} '
-                f'{cisco["source_interface"]}/{src["ip"]}({src["port"]}) -> '
-                f'{cisco["destination_interface"]}/{dst["ip"]}({dst["port"]}) hit-cnt {hit_cnt}'
-            )
-
-        elif msg_id in ["305011", "305012"]:
-            # NAT translation
-            action = "Built" if msg_id == "305011" else "Teardown"
-            global_ip = self._random_ip(private=False)
-            return (
-                f'%ASA-6-{msg_id}: {action} dynamic {protocol} translation from '
-                f'{cisco["source_interface"]}:{src["ip"]}/{src["port"]} to '
-                f'{cisco["destination_interface"]}:{global_ip}/{random.randint(1024, 65535)}'
-            )
-
+            fields["acl"] = self._rng.choice(ACCESS_LISTS)
+            fields["hit_cnt"] = self._rng.randint(1, 1000)
+        elif msg_id in NAT_MSG_IDS:
+            fields["global_ip"] = self._random_ip(private=False)
+            fields["global_port"] = self._rng.randint(1024, 65535)
         elif msg_id == "733100":
-            # Threat detection
-            rate = random.randint(100, 5000)
-            return (
-                f'%ASA-4-{msg_id}: [{msg["type"]}] drop rate exceeded. '
-                f'Current rate: {rate}/sec, trigger rate: 100/sec'
-            )
-
-        elif msg_id == "710003":
-            # TCP access permitted
-            return (
-                f'%ASA-6-{msg_id}: {protocol} access permitted from {src["ip"]}/{src["port"]} '
-                f'to {cisco["destination_interface"]}:{dst["ip"]}/{dst["port"]}'
-            )
-
-        else:
-            # Generic deny messages
-            return (
-                f'%ASA-{msg["severity"]}-{msg_id}: {msg["type"]} from {src["ip"]} to {dst["ip"]} on interface '
-                f'{cisco["source_interface"]}'
-            )
+            fields["rate"] = self._rng.randint(100, 5000)
+
+        return self._MSG_TEMPLATES[msg_id].format_map(fields)
@@ -4,11 +4,13 @@ NGINX log generators.
 Generates realistic NGINX access and error logs following ECS schema.
 """
 
-import random
-from datetime import datetime, timezone
-from typing import Dict, Tuple
+import time
+from collections import namedtuple
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Tuple
 
-from .base import BaseGenerator
+from .base import AliasSampler, BaseGenerator
 
 
 # Sample data pools
@@ -25,7 +27,7 @@ USER_AGENTS = [
 ]
 
 HTTP_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
-HTTP_METHODS_WEIGHTED = ["GET"] * 70 + ["POST"] * 20 + ["PUT"] * 5 + ["DELETE"] * 3 + ["HEAD"] * 2
+HTTP_METHOD_WEIGHTS = {"GET": 70, "POST": 20, "PUT": 5, "DELETE": 3, "HEAD": 2}
 
 URL_PATHS = [
     "/",
@@ -60,20 +62,23 @@ REFERRERS = [
     "https://api-docs.example.com/"
 ]
 
-STATUS_CODES_WEIGHTED = (
-    [200] * 70 +
-    [201] * 5 +
-    [204] * 3 +
-    [301] * 2 +
-    [302] * 3 +
-    [304] * 5 +
-    [400] * 3 +
-    [401] * 2 +
-    [403] * 2 +
-    [404] * 3 +
-    [500] * 1 +
-    [502] * 1
-)
+STATUS_CODE_WEIGHTS = {
+    200: 70,
+    201: 5,
+    204: 3,
+    301: 2,
+    302: 3,
+    304: 5,
+    400: 3,
+    401: 2,
+    403: 2,
+    404: 3,
+    500: 1,
+    502: 1
+}
+
+_METHOD_SAMPLER = AliasSampler(HTTP_METHOD_WEIGHTS)
+_STATUS_SAMPLER = AliasSampler(STATUS_CODE_WEIGHTS)
 
 HOSTNAMES = [
     "web-server-01",
@@ -83,6 +88,40 @@ HOSTNAMES = [
 ]
 
 
+def _body_bytes_range(path: str) -> Tuple[int, int]:
+    """Get a realistic (min, max) response size for a successful request to path."""
+    if path.endswith(('.js', '.css')):
+        return 10000, 500000
+    elif path.endswith(('.png', '.jpg', '.ico')):
+        return 5000, 2000000
+    elif '/api/' in path:
+        return 100, 50000
+    return 500, 20000
+
+
+# Response size ranges, classified once per path instead of per event
+BODY_BYTES_RANGES = {path: _body_bytes_range(path) for path in URL_PATHS}
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=1)
+def _access_log_time(second: int) -> str:
+    """Format epoch seconds as an access log time, e.g. "15/Oct/2026:14:03:52 +0000"."""
+    tm = time.gmtime(second)
+    return (
+        f"{tm.tm_mday:02d}/{_MONTHS[tm.tm_mon - 1]}/{tm.tm_year}:"
+        f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d} +0000"
+    )
+
+
+@lru_cache(maxsize=1)
+def _error_log_time(second: int) -> str:
+    """Format epoch seconds as an error log time, e.g. "2026/10/15 14:03:52"."""
+    tm = time.gmtime(second)
+    return f"{tm.tm_year}/{tm.tm_mon:02d}/{tm.tm_mday:02d} {tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+
+
 class NginxAccessGenerator(BaseGenerator):
     """Generator for NGINX access logs."""
 
@@ -90,85 +129,113 @@ class NginxAccessGenerator(BaseGenerator):
 
     def generate(self) -> Tuple[Dict, str]:
         """Generate an NGINX access log event."""
-        timestamp = self._get_timestamp()
-        client_ip = self._random_ip(private=False)
-        method = random.choice(HTTP_METHODS_WEIGHTED)
-        path = random.choice(URL_PATHS)
-        status = random.choice(STATUS_CODES_WEIGHTED)
-        user_agent = random.choice(USER_AGENTS)
-        referrer = random.choice(REFERRERS)
-        hostname = random.choice(HOSTNAMES)
-
-        # Generate realistic response sizes based on path and status
+        path = self._rng.choice(URL_PATHS)
+        status = _STATUS_SAMPLER.sample(self._rng)
+        event = self._build_event(
+            self._random_ip(private=False),
+            _METHOD_SAMPLER.sample(self._rng),
+            path,
+            status,
+            self._body_bytes(path, status),
+            self._response_time(status),
+            self._rng.choice(USER_AGENTS),
+            self._rng.choice(REFERRERS),
+            self._rng.choice(HOSTNAMES)
+        )
+        return event, self.DATA_STREAM
+
+    def generate_batch(self, n: int) -> List[Tuple[Dict, str]]:
+        """
+        Generate n NGINX access log events.
+
+        Every field is drawn as a column for the whole batch first, then the
+        events are assembled in a single pass over the columns.
+        """
+        paths = self._rng.choices(URL_PATHS, k=n)
+        statuses = _STATUS_SAMPLER.sample_n(self._rng, n)
+        columns = zip(
+            self._random_ips(n, private=False),
+            _METHOD_SAMPLER.sample_n(self._rng, n),
+            paths,
+            statuses,
+            [self._body_bytes(path, status) for path, status in zip(paths, statuses)],
+            [self._response_time(status) for status in statuses],
+            self._rng.choices(USER_AGENTS, k=n),
+            self._rng.choices(REFERRERS, k=n),
+            self._rng.choices(HOSTNAMES, k=n)
+        )
+        return [(self._build_event(*fields), self.DATA_STREAM) for fields in columns]
+
+    def _body_bytes(self, path: str, status: int) -> int:
+        """Generate a realistic response size based on path and status."""
         if status >= 400:
-            body_bytes = random.randint(200, 1000)
-        elif path.endswith(('.js', '.css')):
-            body_bytes = random.randint(10000, 500000)
-        elif path.endswith(('.png', '.jpg', '.ico')):
-            body_bytes = random.randint(5000, 2000000)
-        elif '/api/' in path:
-            body_bytes = random.randint(100, 50000)
-        else:
-            body_bytes = random.randint(500, 20000)
-
-        # Response time in seconds
-        response_time = random.uniform(0.001, 2.0)
+            return self._rng.randint(200, 1000)
+        return self._rng.randint(*BODY_BYTES_RANGES[path])
+
+    def _response_time(self, status: int) -> float:
+        """Generate a response time in seconds."""
         if status >= 500:
-            response_time = random.uniform(1.0, 30.0)
+            return self._rng.uniform(1.0, 30.0)
+        return self._rng.uniform(0.001, 2.0)
 
-        event = self._base_event("nginx.access", "nginx")
+    def _build_event(self, client_ip: str, method: str, path: str, status: int, body_bytes: int,
+                     response_time: float, user_agent: str, referrer: str, hostname: str) -> Dict:
+        """Assemble an NGINX access log event from its drawn fields."""
+        now = time.time()
+        event = self._base_event("nginx.access", "nginx", now)
 
-        event.update({
-            "host": {
-                "name": hostname,
-                "hostname": hostname
-            },
-            "source": {
-                "ip": client_ip,
-                "address": client_ip
-            },
-            "url": {
-                "path": path,
-                "original": path
-            },
-            "http": {
-                "request": {
-                    "method": method,
-                    "referrer": referrer if referrer != "-" else None
-                },
-                "response": {
-                    "status_code": status,
-                    "body": {
-                        "bytes": body_bytes
-                    }
-                },
-                "version": "1.1"
-            },
-            "user_agent": {
-                "original": user_agent
-            },
-            "event": {
-                **event["event"],
-                "category": ["web"],
-                "type": ["access"],
-                "outcome": "success" if status < 400 else "failure",
-                "duration": int(response_time * 1e9)  # nanoseconds
+        event["event"].update({
+            "category": ["web"],
+            "type": ["access"],
+            "outcome": "success" if status < 400 else "failure",
+            "duration": int(response_time * 1e9)  # nanoseconds
+        })
+
+        event["host"] = {
+            "name": hostname,
+            "hostname": hostname
+        }
+        event["source"] = {
+            "ip": client_ip,
+            "address": client_ip
+        }
+        event["url"] = {
+            "path": path,
+            "original": path
+        }
+        event["http"] = {
+            "request": {
+                "method": method,
+                "referrer": referrer if referrer != "-" else None
             },
-            "nginx": {
-                "access": {
-                    "remote_ip_list": [client_ip]
+            "response": {
+                "status_code": status,
+                "body": {
+                    "bytes": body_bytes
                 }
+            },
+            "version": "1.1"
+        }
+        event["user_agent"] = {
+            "original": user_agent
+        }
+        event["nginx"] = {
+            "access": {
+                "remote_ip_list": [client_ip]
             }
-        })
+        }
 
         # Build log message in combined format
         event["message"] = (
-            f'{client_ip} - - [{datetime.now().strftime("%d/%b/%Y:%H:%M:%S %z")}] '
+            f'{client_ip} - - [{_access_log_time(int(now))}] '
             f'"{method} {path} HTTP/1.1" {status} {body_bytes} '
             f'"{referrer}" "{user_agent}"'
         )
 
-        return event, self.DATA_STREAM
+        return event
+
+
+ErrorType = namedtuple("ErrorType", "level message weight")
 
 
 class NginxErrorGenerator(BaseGenerator):
@@ -176,60 +243,38 @@ class NginxErrorGenerator(BaseGenerator):
 
     DATA_STREAM = "logs-nginx.error-default"
 
-    ERROR_TYPES = [
-        {
-            "level": "error",
-            "message": "connect() failed (111: Connection refused) while connecting to upstream",
-            "weight": 25
-        },
-        {
-            "level": "error",
-            "message": "upstream timed out (110: Connection timed out) while reading response header from upstream",
-            "weight": 20
-        },
-        {
-            "level": "warn",
-            "message": "client intended to send too large body",
-            "weight": 15
-        },
-        {
-            "level": "error",
-            "message": "open() \"/var/www/html/favicon.ico\" failed (2: No such file or directory)",
-            "weight": 20
-        },
-        {
-            "level": "crit",
-            "message": "SSL_do_handshake() failed (SSL: error:14094412:SSL routines:ssl3_read_bytes:sslv3 alert bad certificate)",
-            "weight": 5
-        },
-        {
-            "level": "error",
-            "message": "limiting requests, excess: 10.520 by zone \"api_limit\"",
-            "weight": 10
-        },
-        {
-            "level": "warn",
-            "message": "upstream server temporarily disabled while connecting to upstream",
-            "weight": 5
-        }
-    ]
+    ERROR_TYPES = (
+        ErrorType("error", "connect() failed (111: Connection refused) while connecting to upstream", 25),
+        ErrorType("error", "upstream timed out (110: Connection timed out) while reading response header from upstream", 20),
+        ErrorType("warn", "client intended to send too large body", 15),
+        ErrorType("error", "open() \"/var/www/html/favicon.ico\" failed (2: No such file or directory)", 20),
+        ErrorType("crit", "SSL_do_handshake() failed (SSL: error:14094412:SSL routines:ssl3_read_bytes:sslv3 alert bad certificate)", 5),
+        ErrorType("error", "limiting requests, excess: 10.520 by zone \"api_limit\"", 10),
+        ErrorType("warn", "upstream server temporarily disabled while connecting to upstream", 5)
+    )
+    _ERROR_CUM = list(accumulate(e.weight for e in ERROR_TYPES))
 
     def generate(self) -> Tuple[Dict, str]:
         """Generate an NGINX error log event."""
-        timestamp = self._get_timestamp()
-        hostname = random.choice(HOSTNAMES)
+        hostname = self._rng.choice(HOSTNAMES)
         client_ip = self._random_ip(private=False)
 
         # Weighted selection of error type
-        weights = [e["weight"] for e in self.ERROR_TYPES]
-        error = random.choices(self.ERROR_TYPES, weights=weights)[0]
+        error = self._weighted_choice(self.ERROR_TYPES, self._ERROR_CUM)
 
-        pid = random.randint(1000, 65000)
-        tid = random.randint(1, 100)
-        connection = random.randint(100000, 999999)
-        request_path = random.choice(URL_PATHS)
+        pid = self._rng.randint(1000, 65000)
+        tid = self._rng.randint(1, 100)
+        connection = self._rng.randint(100000, 999999)
+        request_path = self._rng.choice(URL_PATHS)
 
-        event = self._base_event("nginx.error", "nginx")
+        now = time.time()
+        event = self._base_event("nginx.error", "nginx", now)
+
+        event["event"].update({
+            "category": ["web"],
+            "type": ["error"],
+            "outcome": "failure"
+        })
 
         event.update({
             "host": {
@@ -247,13 +292,7 @@ class NginxErrorGenerator(BaseGenerator):
                 }
             },
             "log": {
-                "level": error["level"]
-            },
-            "event": {
-                **event["event"],
-                "category": ["web"],
-                "type": ["error"],
-                "outcome": "failure"
+                "level": error.level
             },
             "nginx": {
                 "error": {
@@ -267,8 +306,8 @@ class NginxErrorGenerator(BaseGenerator):
 
         # Format error message
         event["message"] = (
-            f'{datetime.now().strftime("%Y/%m/%d %H:%M:%S")} [{error["level"]}] '
-            f'{pid}#{tid}: *{connection} {error["message"]}, '
+            f'{_error_log_time(int(now))} [{error.level}] '
+            f'{pid}#{tid}: *{connection} {error.message}, '
             f'client: {client_ip}, request: "GET {request_path} HTTP/1.1"'
         )
 
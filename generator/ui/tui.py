@@ -5,13 +5,20 @@ Simple curses-based TUI for selecting and managing integrations.
 
 import curses
 import time
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from main import DataGenerator
+    from main import DataGenerator, IntegrationState
 
 from integrations import AVAILABLE_INTEGRATIONS
 
+# Rows taken by the header and footer windows; the body window gets the rest
+HEADER_HEIGHT = 5
+FOOTER_HEIGHT = 2
+
+# Status view columns, starting at x=4: integration, dataset, EPS, events, status
+STATUS_HEADER = f"{'Integration':<26}{'Dataset':<20}{'EPS':<8}{'Events':<12}Status"
+
 
 class IntegrationTUI:
     """Terminal UI for managing integrations."""
@@ -19,6 +26,13 @@ class IntegrationTUI:
     def __init__(self, generator: 'DataGenerator'):
         self.generator = generator
         self.screen = None
+        self.header_win = None
+        self.body_win = None
+        self.footer_win = None
+        self._hline = ""
+        self._inner_hline = ""
+        self._blank_line = ""
+        self._footer_view = None
         self.current_view = "integrations"  # integrations, datasets, config, status
         self.selected_integration = None
         self.selected_dataset = None
@@ -26,9 +40,42 @@ class IntegrationTUI:
         self.eps_value = 1.0
         self.scroll_offset = 0
 
+        # Redraw only when input or the status counters changed something
+        self._dirty = True
+        self._last_status = None
+
+        # Running integrations, listed at most once per drawn frame
+        self._frame_id = 0
+        self._running_cache = (-1, [])
+
+        # Last cursor position in the drawn view, set by each _draw_* view
+        self._max_pos = 0
+
         # Get sorted list of integrations
         self.integration_list = sorted(AVAILABLE_INTEGRATIONS.keys())
 
+        # Per-integration metadata used on every frame, looked up once
+        self._datasets_by_integration = {
+            name: list(AVAILABLE_INTEGRATIONS[name]["datasets"].keys())
+            for name in self.integration_list
+        }
+        self._desc_by_integration = {
+            name: AVAILABLE_INTEGRATIONS[name].get("description", "")
+            for name in self.integration_list
+        }
+        self._dataset_descs_by_integration = {
+            name: [info.get("description", "") for info in AVAILABLE_INTEGRATIONS[name]["datasets"].values()]
+            for name in self.integration_list
+        }
+
+        # Row labels, selected and unselected, so list draws don't format strings
+        self._row_selected = [f" ▶ {name}" for name in self.integration_list]
+        self._row_unselected = [f"   {name}" for name in self.integration_list]
+        self._dataset_rows_by_integration = {
+            name: ([f" ▶ {ds}" for ds in datasets], [f"   {ds}" for ds in datasets])
+            for name, datasets in self._datasets_by_integration.items()
+        }
+
     def run(self):
         """Run the TUI."""
         curses.wrapper(self._main)
@@ -38,6 +85,10 @@ class IntegrationTUI:
         self.screen = screen
         curses.curs_set(0)  # Hide cursor
 
+        # Don't poll stdin for typeahead during doupdate(), so each frame is
+        # written out whole in one flush rather than split around key checks
+        curses.typeahead(-1)
+
         # Setup colors
         curses.start_color()
         curses.use_default_colors()
@@ -47,52 +98,130 @@ class IntegrationTUI:
         curses.init_pair(4, curses.COLOR_CYAN, -1)    # Info
         curses.init_pair(5, curses.COLOR_WHITE, curses.COLOR_BLUE)  # Selected
 
-        while True:
-            self.screen.clear()
-            self._draw_header()
+        # Resolve attributes once rather than on every draw call
+        self._attr_ok = curses.color_pair(1)
+        self._attr_err = curses.color_pair(2)
+        self._attr_warn = curses.color_pair(3)
+        self._attr_info = curses.color_pair(4)
+        self._attr_sel = curses.color_pair(5)
+        self._attr_ok_bold = self._attr_ok | curses.A_BOLD
+        self._attr_warn_bold = self._attr_warn | curses.A_BOLD
 
-            if self.current_view == "integrations":
-                self._draw_integrations()
-            elif self.current_view == "datasets":
-                self._draw_datasets()
-            elif self.current_view == "config":
-                self._draw_config()
-            elif self.current_view == "status":
-                self._draw_status()
+        self._create_windows()
 
-            self._draw_footer()
-            self.screen.refresh()
+        while True:
+            if self._dirty:
+                self._draw_frame()
+                self._dirty = False
+
+            # Counters in the status view change without input - poll them
+            # at up to 10 Hz; other views block until a key is pressed
+            self.screen.timeout(100 if self.current_view == "status" else -1)
 
             # Handle input
             key = self.screen.getch()
+            if key == -1:
+                # Timed out: redraw the status body only if its counters moved
+                if self.current_view == "status" and self._status_snapshot() != self._last_status:
+                    self._draw_status_body()
+                continue
             if not self._handle_input(key):
                 break
 
+    def _draw_frame(self):
+        """Draw the current view and write it to the terminal."""
+        self._frame_id += 1
+
+        # erase() rather than clear(): curses keeps the previous frame and
+        # only sends the cells that changed, instead of repainting everything
+        self.body_win.erase()
+
+        if self.current_view == "integrations":
+            self._draw_integrations()
+        elif self.current_view == "datasets":
+            self._draw_datasets()
+        elif self.current_view == "config":
+            self._draw_config()
+        elif self.current_view == "status":
+            self._last_status = self._status_snapshot()
+            self._draw_status()
+
+        # The header is drawn with the windows; the footer only changes with the view
+        if self._footer_view != self.current_view:
+            self.footer_win.erase()
+            self._draw_footer()
+            self._footer_view = self.current_view
+
+        # Stage every window, then write the combined changes once
+        self.screen.noutrefresh()
+        self.header_win.noutrefresh()
+        self.body_win.noutrefresh()
+        self.footer_win.noutrefresh()
+        curses.doupdate()
+
+    def _draw_status_body(self):
+        """Redraw just the status view body, leaving the header and footer as drawn."""
+        self._frame_id += 1
+        self._last_status = self._status_snapshot()
+        self.body_win.erase()
+        self._draw_status()
+        self.body_win.noutrefresh()
+        curses.doupdate()
+
+    def _status_snapshot(self):
+        """Get the values shown in the status view, to detect when it needs a redraw."""
+        return tuple(
+            (state.running, state.total_events)
+            for state in self.generator.integrations.values()
+        )
+
+    def _create_windows(self):
+        """Create the header, body and footer windows for the current terminal size."""
+        height, width = self.screen.getmaxyx()
+        body_height = max(1, height - HEADER_HEIGHT - FOOTER_HEIGHT)
+
+        self.header_win = curses.newwin(HEADER_HEIGHT, width, 0, 0)
+        self.body_win = curses.newwin(body_height, width, HEADER_HEIGHT, 0)
+        self.footer_win = curses.newwin(FOOTER_HEIGHT, width, HEADER_HEIGHT + body_height, 0)
+
+        # The cursor is hidden, so let curses leave it wherever the last
+        # update ended rather than sending a move back after every refresh
+        for win in (self.screen, self.header_win, self.body_win, self.footer_win):
+            win.leaveok(True)
+
+        # Separators and the row highlight only change with the width
+        self._hline = "─" * width
+        self._inner_hline = "─" * (width - 4)
+        self._blank_line = " " * (width - 4)
+
+        # The header doesn't depend on the view - draw it once per window set
+        self._draw_header()
+        self._footer_view = None
+
     def _draw_header(self):
         """Draw the header bar."""
-        height, width = self.screen.getmaxyx()
+        win = self.header_win
+        height, width = win.getmaxyx()
         title = " Elastic Integration Data Generator "
         subtitle = "Air-Gapped Edition - All data embedded"
 
         # Title
-        self.screen.attron(curses.A_BOLD)
-        self.screen.addstr(0, (width - len(title)) // 2, title)
-        self.screen.attroff(curses.A_BOLD)
+        win.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
 
         # Subtitle
-        self.screen.attron(curses.color_pair(4))
-        self.screen.addstr(1, (width - len(subtitle)) // 2, subtitle)
-        self.screen.attroff(curses.color_pair(4))
+        win.addstr(1, (width - len(subtitle)) // 2, subtitle, self._attr_info)
 
         # Navigation tabs
         tabs = ["[I]ntegrations", "[S]tatus", "[Q]uit"]
         tab_str = "  ".join(tabs)
-        self.screen.addstr(3, 2, tab_str)
-        self.screen.addstr(4, 0, "─" * width)
+        win.addstr(3, 2, tab_str)
+        # insstr: addstr would fail writing the window's bottom-right cell
+        win.insstr(4, 0, self._hline)
 
     def _draw_footer(self):
         """Draw the footer with help."""
-        height, width = self.screen.getmaxyx()
+        win = self.footer_win
+        height, width = win.getmaxyx()
 
         if self.current_view == "integrations":
             help_text = "↑↓:Navigate  Enter:Select  S:Status  Q:Quit"
@@ -105,21 +234,20 @@ class IntegrationTUI:
         else:
             help_text = "Q:Quit"
 
-        self.screen.addstr(height - 2, 0, "─" * width)
-        self.screen.attron(curses.color_pair(4))
-        self.screen.addstr(height - 1, 2, help_text[:width-4])
-        self.screen.attroff(curses.color_pair(4))
+        win.addstr(0, 0, self._hline)
+        win.addnstr(1, 2, help_text, max(0, width - 4), self._attr_info)
 
     def _draw_integrations(self):
         """Draw the integrations list."""
-        height, width = self.screen.getmaxyx()
-        start_y = 6
-        max_items = height - 10
+        win = self.body_win
+        height, width = win.getmaxyx()
+        start_y = 1
+        max_items = height - 3
 
         # Title
-        self.screen.attron(curses.A_BOLD)
-        self.screen.addstr(start_y - 1, 2, f"Available Integrations ({len(self.integration_list)})")
-        self.screen.attroff(curses.A_BOLD)
+        win.addstr(start_y - 1, 2, f"Available Integrations ({len(self.integration_list)})", curses.A_BOLD)
+
+        self._max_pos = len(self.integration_list) - 1
 
         # Adjust scroll
         if self.cursor_pos >= self.scroll_offset + max_items:
@@ -127,162 +255,155 @@ class IntegrationTUI:
         elif self.cursor_pos < self.scroll_offset:
             self.scroll_offset = self.cursor_pos
 
+        running_counts = self._running_counts()
+
         # Draw list
         for i, integration in enumerate(self.integration_list[self.scroll_offset:self.scroll_offset + max_items]):
             y = start_y + i
             idx = self.scroll_offset + i
 
             # Check if any datasets are running
-            running_count = 0
-            integration_info = AVAILABLE_INTEGRATIONS[integration]
-            for dataset in integration_info["datasets"]:
-                key = f"{integration}:{dataset}"
-                if key in self.generator.integrations and self.generator.integrations[key].running:
-                    running_count += 1
+            running_count = running_counts.get(integration, 0)
 
             # Format line
             if running_count > 0:
                 status = f"[{running_count} running]"
-                status_color = curses.color_pair(1)
+                status_color = self._attr_ok
             else:
                 status = ""
                 status_color = 0
 
             # Highlight selected
             if idx == self.cursor_pos:
-                self.screen.attron(curses.color_pair(5))
-                self.screen.addstr(y, 2, " " * (width - 4))
-                self.screen.addstr(y, 2, f" ▶ {integration}")
+                win.addstr(y, 2, self._blank_line, self._attr_sel)
+                win.addstr(y, 2, self._row_selected[idx], self._attr_sel)
                 if status:
-                    self.screen.addstr(y, 40, status)
-                self.screen.attroff(curses.color_pair(5))
+                    win.addstr(y, 40, status, self._attr_sel)
             else:
-                self.screen.addstr(y, 2, f"   {integration}")
+                win.addstr(y, 2, self._row_unselected[idx])
                 if status:
-                    self.screen.attron(status_color)
-                    self.screen.addstr(y, 40, status)
-                    self.screen.attroff(status_color)
+                    win.addstr(y, 40, status, status_color)
 
         # Scroll indicator
         if len(self.integration_list) > max_items:
             indicator = f" [{self.scroll_offset + 1}-{min(self.scroll_offset + max_items, len(self.integration_list))}/{len(self.integration_list)}]"
-            self.screen.addstr(start_y - 1, width - len(indicator) - 2, indicator)
+            win.addstr(start_y - 1, width - len(indicator) - 2, indicator)
+
+    def _get_running(self) -> List[Tuple[str, 'IntegrationState']]:
+        """
+        Get the running integrations as (key, state) pairs.
+
+        Listed once per frame, so input handling sees the same list as the
+        last frame drawn.
+        """
+        frame_id, running = self._running_cache
+        if frame_id != self._frame_id:
+            running = [(k, v) for k, v in self.generator.integrations.items() if v.running]
+            self._running_cache = (self._frame_id, running)
+        return running
+
+    def _running_counts(self) -> Dict[str, int]:
+        """Count running datasets per integration."""
+        counts = {}
+        for _, state in self._get_running():
+            counts[state.name] = counts.get(state.name, 0) + 1
+        return counts
 
     def _draw_datasets(self):
         """Draw datasets for selected integration."""
-        height, width = self.screen.getmaxyx()
-        start_y = 6
+        win = self.body_win
+        height, width = win.getmaxyx()
+        start_y = 1
+        self._max_pos = 0
 
         if not self.selected_integration:
             return
 
-        integration_info = AVAILABLE_INTEGRATIONS[self.selected_integration]
-        datasets = list(integration_info["datasets"].keys())
+        datasets = self._datasets_by_integration[self.selected_integration]
+        self._max_pos = len(datasets) - 1
+        dataset_descs = self._dataset_descs_by_integration[self.selected_integration]
+        rows_selected, rows_unselected = self._dataset_rows_by_integration[self.selected_integration]
 
         # Title
-        self.screen.attron(curses.A_BOLD)
-        self.screen.addstr(start_y - 1, 2, f"{self.selected_integration} - Select Dataset")
-        self.screen.attroff(curses.A_BOLD)
+        win.addstr(start_y - 1, 2, f"{self.selected_integration} - Select Dataset", curses.A_BOLD)
 
         # Description
-        desc = integration_info.get("description", "")[:width-6]
-        self.screen.attron(curses.color_pair(4))
-        self.screen.addstr(start_y, 2, desc)
-        self.screen.attroff(curses.color_pair(4))
+        desc = self._desc_by_integration[self.selected_integration]
+        win.addnstr(start_y, 2, desc, max(0, width - 6), self._attr_info)
 
         # Draw datasets
         for i, dataset in enumerate(datasets):
             y = start_y + 2 + i
-            dataset_info = integration_info["datasets"][dataset]
 
             # Check if running
             key = f"{self.selected_integration}:{dataset}"
             if key in self.generator.integrations and self.generator.integrations[key].running:
                 status = "[RUNNING]"
-                status_color = curses.color_pair(1)
+                status_color = self._attr_ok
             else:
                 status = ""
                 status_color = 0
 
             # Highlight selected
             if i == self.cursor_pos:
-                self.screen.attron(curses.color_pair(5))
-                self.screen.addstr(y, 2, " " * (width - 4))
-                self.screen.addstr(y, 2, f" ▶ {dataset}")
+                win.addstr(y, 2, self._blank_line, self._attr_sel)
+                win.addstr(y, 2, rows_selected[i], self._attr_sel)
                 if status:
-                    self.screen.addstr(y, 30, status)
-                self.screen.attroff(curses.color_pair(5))
+                    win.addstr(y, 30, status, self._attr_sel)
             else:
-                self.screen.addstr(y, 2, f"   {dataset}")
+                win.addstr(y, 2, rows_unselected[i])
                 if status:
-                    self.screen.attron(status_color)
-                    self.screen.addstr(y, 30, status)
-                    self.screen.attroff(status_color)
+                    win.addstr(y, 30, status, status_color)
 
             # Dataset description
-            ds_desc = dataset_info.get("description", "")[:width-40]
-            self.screen.attron(curses.color_pair(4))
-            self.screen.addstr(y, 50, ds_desc[:width-52])
-            self.screen.attroff(curses.color_pair(4))
+            win.addnstr(y, 50, dataset_descs[i], max(0, width - 52), self._attr_info)
 
     def _draw_config(self):
         """Draw configuration screen for starting an integration."""
-        height, width = self.screen.getmaxyx()
-        start_y = 6
+        win = self.body_win
+        height, width = win.getmaxyx()
+        start_y = 1
+        self._max_pos = 0
 
         # Title
-        self.screen.attron(curses.A_BOLD)
-        self.screen.addstr(start_y, 2, f"Configure: {self.selected_integration} / {self.selected_dataset}")
-        self.screen.attroff(curses.A_BOLD)
+        win.addstr(start_y, 2, f"Configure: {self.selected_integration} / {self.selected_dataset}", curses.A_BOLD)
 
         # EPS setting
-        self.screen.addstr(start_y + 3, 4, "Events per second:")
-        self.screen.attron(curses.color_pair(3) | curses.A_BOLD)
-        self.screen.addstr(start_y + 3, 25, f"< {self.eps_value:.1f} >")
-        self.screen.attroff(curses.color_pair(3) | curses.A_BOLD)
+        win.addstr(start_y + 3, 4, "Events per second:")
+        win.addstr(start_y + 3, 25, f"< {self.eps_value:.1f} >", self._attr_warn_bold)
 
         # Data stream info
         integration_info = AVAILABLE_INTEGRATIONS[self.selected_integration]
         dataset_info = integration_info["datasets"][self.selected_dataset]
         data_stream = dataset_info.get("data_stream", "logs-*")
 
-        self.screen.addstr(start_y + 5, 4, "Data stream:")
-        self.screen.attron(curses.color_pair(4))
-        self.screen.addstr(start_y + 5, 18, data_stream)
-        self.screen.attroff(curses.color_pair(4))
+        win.addstr(start_y + 5, 4, "Data stream:")
+        win.addstr(start_y + 5, 18, data_stream, self._attr_info)
 
         # Start button
-        self.screen.attron(curses.color_pair(1) | curses.A_BOLD)
-        self.screen.addstr(start_y + 8, 4, "[ Press ENTER to START ]")
-        self.screen.attroff(curses.color_pair(1) | curses.A_BOLD)
+        win.addstr(start_y + 8, 4, "[ Press ENTER to START ]", self._attr_ok_bold)
 
     def _draw_status(self):
         """Draw status of running integrations."""
-        height, width = self.screen.getmaxyx()
-        start_y = 6
+        win = self.body_win
+        height, width = win.getmaxyx()
+        start_y = 1
 
         # Title
-        self.screen.attron(curses.A_BOLD)
-        self.screen.addstr(start_y - 1, 2, "Running Integrations")
-        self.screen.attroff(curses.A_BOLD)
+        win.addstr(start_y - 1, 2, "Running Integrations", curses.A_BOLD)
 
         # Get running integrations
-        running = [(k, v) for k, v in self.generator.integrations.items() if v.running]
+        running = self._get_running()
+        self._max_pos = max(0, len(running) - 1)
 
         if not running:
-            self.screen.attron(curses.color_pair(3))
-            self.screen.addstr(start_y + 1, 4, "No integrations running")
-            self.screen.addstr(start_y + 2, 4, "Press 'I' to go to Integrations and start one")
-            self.screen.attroff(curses.color_pair(3))
+            win.addstr(start_y + 1, 4, "No integrations running", self._attr_warn)
+            win.addstr(start_y + 2, 4, "Press 'I' to go to Integrations and start one", self._attr_warn)
             return
 
         # Header
-        self.screen.addstr(start_y, 4, "Integration")
-        self.screen.addstr(start_y, 30, "Dataset")
-        self.screen.addstr(start_y, 50, "EPS")
-        self.screen.addstr(start_y, 58, "Events")
-        self.screen.addstr(start_y, 70, "Status")
-        self.screen.addstr(start_y + 1, 2, "─" * (width - 4))
+        win.addstr(start_y, 4, STATUS_HEADER)
+        win.addstr(start_y + 1, 2, self._inner_hline)
 
         # List running integrations
         for i, (key, state) in enumerate(running):
@@ -290,29 +411,26 @@ class IntegrationTUI:
 
             # Highlight selected
             if i == self.cursor_pos:
-                self.screen.attron(curses.color_pair(5))
-                self.screen.addstr(y, 2, " " * (width - 4))
+                row_attr = self._attr_sel
+                win.addstr(y, 2, self._blank_line, row_attr)
+            else:
+                row_attr = 0
 
-            self.screen.addstr(y, 4, state.name[:24])
-            self.screen.addstr(y, 30, state.dataset[:18])
-            self.screen.addstr(y, 50, f"{state.events_per_second:.1f}")
-            self.screen.addstr(y, 58, f"{state.total_events:,}")
+            win.addstr(
+                y, 4,
+                f"{state.name:<26.24}{state.dataset:<20.18}"
+                f"{state.events_per_second:<8.1f}{state.total_events:<12,}",
+                row_attr
+            )
 
             if state.running:
-                self.screen.attron(curses.color_pair(1))
-                self.screen.addstr(y, 70, "● Running")
-                self.screen.attroff(curses.color_pair(1))
+                win.addstr(y, 70, "● Running", self._attr_ok)
             else:
-                self.screen.attron(curses.color_pair(2))
-                self.screen.addstr(y, 70, "○ Stopped")
-                self.screen.attroff(curses.color_pair(2))
-
-            if i == self.cursor_pos:
-                self.screen.attroff(curses.color_pair(5))
+                win.addstr(y, 70, "○ Stopped", self._attr_err)
 
         # Total events
         total = sum(s.total_events for _, s in running)
-        self.screen.addstr(height - 4, 4, f"Total events generated: {total:,}")
+        win.addstr(height - 2, 4, f"Total events generated: {total:,}")
 
     def _handle_input(self, key) -> bool:
         """Handle keyboard input. Returns False to exit."""
@@ -360,19 +478,20 @@ class IntegrationTUI:
         elif key == 10 or key == curses.KEY_ENTER:  # Enter
             self._handle_enter()
 
+        elif key == curses.KEY_RESIZE:
+            # Rebuild the windows and force a full repaint at the new size
+            self._create_windows()
+            self.screen.clear()
+
+        else:
+            return True  # Unhandled key - nothing to redraw
+
+        self._dirty = True
         return True
 
     def _get_max_cursor_pos(self) -> int:
-        """Get maximum cursor position for current view."""
-        if self.current_view == "integrations":
-            return len(self.integration_list) - 1
-        elif self.current_view == "datasets":
-            if self.selected_integration:
-                return len(AVAILABLE_INTEGRATIONS[self.selected_integration]["datasets"]) - 1
-        elif self.current_view == "status":
-            running = [k for k, v in self.generator.integrations.items() if v.running]
-            return max(0, len(running) - 1)
-        return 0
+        """Get maximum cursor position for current view, as of the last frame drawn."""
+        return self._max_pos
 
     def _handle_enter(self):
         """Handle Enter key press."""
@@ -384,8 +503,7 @@ class IntegrationTUI:
 
         elif self.current_view == "datasets":
             # Select dataset, go to config
-            datasets = list(AVAILABLE_INTEGRATIONS[self.selected_integration]["datasets"].keys())
-            self.selected_dataset = datasets[self.cursor_pos]
+            self.selected_dataset = self._datasets_by_integration[self.selected_integration][self.cursor_pos]
             self.current_view = "config"
             self.eps_value = 1.0
 
@@ -402,7 +520,7 @@ class IntegrationTUI:
 
         elif self.current_view == "status":
             # Stop the selected integration
-            running = [(k, v) for k, v in self.generator.integrations.items() if v.running]
+            running = self._get_running()
             if running and self.cursor_pos < len(running):
                 key, state = running[self.cursor_pos]
                 self.generator.stop_integration(state.name, state.dataset)